@@ -0,0 +1,155 @@
+"""
+MPI Code Challenge: Scaling Benchmark
+=====================================
+
+Runs solution.py across several process counts and problem sizes and
+writes a machine-readable scaling report.
+
+  strong scaling: the total number of points stays fixed as ranks are added
+  weak scaling:   the number of points per rank stays fixed as ranks are added
+
+Speedup and efficiency are relative to the smallest rank count in the
+sweep. Each configuration is repeated and the fastest run is kept.
+
+Run with: python benchmark.py --ranks 1 2 4 8 --points 10_000_000 100_000_000
+          python benchmark.py --mode weak --points 10_000_000 --output report.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import subprocess
+import sys
+
+SOLUTION = os.path.join(os.path.dirname(os.path.abspath(__file__)), "solution.py")
+
+REPORT_FIELDS = [
+    "mode", "ranks", "threads", "total_points", "points_per_rank",
+    "compute_time_s", "reduce_time_s", "wall_time_s",
+    "speedup", "efficiency", "points_per_s_per_rank",
+    "pi_estimate", "error",
+]
+
+
+def run_estimator(ranks: int, total_points: int, mpiexec: list, solution_args: list) -> dict:
+    """Launch one solution.py run and return its JSON record."""
+    command = [
+        *mpiexec, "-n", str(ranks),
+        sys.executable, SOLUTION,
+        "--points", str(total_points), "--json", *solution_args,
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True, check=True)
+    # Rank 0 prints the record on the last line; MPI launchers may add noise above it
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def best_of(repeats: int, ranks: int, total_points: int, mpiexec: list, solution_args: list) -> dict:
+    """Repeat a configuration and keep the run with the shortest wall time."""
+    runs = [run_estimator(ranks, total_points, mpiexec, solution_args) for _ in range(repeats)]
+    return min(runs, key=lambda r: r["compute_time_s"] + r["reduce_time_s"])
+
+
+def scaling_rows(mode: str, rank_counts: list, size: int, repeats: int,
+                 mpiexec: list, solution_args: list) -> list:
+    """Benchmark one problem size across all rank counts.
+
+    `size` is the total number of points for strong scaling and the number
+    of points per rank for weak scaling.
+    """
+    rows = []
+    baseline = None
+    for ranks in rank_counts:
+        total_points = size if mode == "strong" else size * ranks
+        record = best_of(repeats, ranks, total_points, mpiexec, solution_args)
+        wall = record["compute_time_s"] + record["reduce_time_s"]
+        if baseline is None:
+            baseline = (ranks, wall)
+        base_ranks, base_wall = baseline
+
+        if mode == "strong":
+            speedup = base_wall / wall
+            efficiency = speedup * base_ranks / ranks
+        else:
+            efficiency = base_wall / wall
+            speedup = efficiency * ranks / base_ranks
+
+        rows.append({
+            "mode": mode,
+            "ranks": ranks,
+            "threads": record.get("threads", 1),
+            "total_points": record["total_points"],
+            "points_per_rank": record["total_points"] // ranks,
+            "compute_time_s": record["compute_time_s"],
+            "reduce_time_s": record["reduce_time_s"],
+            "wall_time_s": wall,
+            "speedup": speedup,
+            "efficiency": efficiency,
+            "points_per_s_per_rank": record["total_points"] / wall / ranks,
+            "pi_estimate": record["pi_estimate"],
+            "error": record["error"],
+        })
+    return rows
+
+
+def write_report(rows: list, path: str):
+    """Write rows as CSV if `path` ends in .csv, otherwise as JSON."""
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Strong/weak scaling benchmark for solution.py")
+    parser.add_argument("--ranks", type=int, nargs="+", default=[1, 2, 4],
+                        help="process counts to run")
+    parser.add_argument("--points", type=int, nargs="+", default=[10_000_000],
+                        help="problem sizes: total points (strong) or points per rank (weak)")
+    parser.add_argument("--mode", choices=["strong", "weak", "both"], default="both")
+    parser.add_argument("--repeats", type=int, default=3,
+                        help="runs per configuration; the fastest is kept")
+    parser.add_argument("--mpiexec", default="mpiexec",
+                        help="MPI launcher command, e.g. 'mpirun --oversubscribe'")
+    parser.add_argument("--output", default="benchmark_report.json",
+                        help="report path; .csv for CSV, anything else for JSON")
+    args, solution_args = parser.parse_known_args(argv)
+    if min(args.ranks) < 1 or min(args.points) < 1 or args.repeats < 1:
+        parser.error("--ranks, --points and --repeats must be positive")
+    args.ranks = sorted(set(args.ranks))
+    # Anything not recognised here (e.g. --chunk-size, --schedule) goes to solution.py
+    args.solution_args = solution_args
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    modes = ["strong", "weak"] if args.mode == "both" else [args.mode]
+    mpiexec = args.mpiexec.split()
+
+    rows = []
+    for mode in modes:
+        for size in args.points:
+            rows.extend(scaling_rows(mode, args.ranks, size, args.repeats,
+                                     mpiexec, args.solution_args))
+
+    print(f"{'mode':6s} {'ranks':>5s} {'points':>14s} {'compute (s)':>11s} "
+          f"{'reduce (s)':>10s} {'speedup':>7s} {'eff':>5s} {'pts/s/rank':>12s}")
+    for row in rows:
+        print(
+            f"{row['mode']:6s} {row['ranks']:5d} {row['total_points']:14,d} "
+            f"{row['compute_time_s']:11.4f} {row['reduce_time_s']:10.6f} "
+            f"{row['speedup']:7.2f} {row['efficiency']:5.2f} "
+            f"{row['points_per_s_per_rank']:12.3e}"
+        )
+
+    write_report(rows, args.output)
+    print(f"\nReport written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+MPI Code Challenge: Checkpoint/Restart
+======================================
+
+Coordinated checkpoints for long Monte Carlo runs.
+
+Each rank writes a small JSON file with its progress (rounds done, points
+done, hits) and the exact state of its random generators. Files alternate
+between two slots, so the previous checkpoint survives if a job dies
+while writing the next one. Only after every rank has finished writing
+does rank 0 update the manifest, which names the last consistent epoch.
+A restart reads the manifest and resumes every rank from that epoch.
+"""
+
+import json
+import os
+import numpy as np
+
+MANIFEST = "manifest.json"
+
+
+def _write_json(path: str, data: dict):
+    """Write `data` to `path` atomically (write a temp file, then rename)."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        # NumPy generator states hold small uint64 arrays
+        json.dump(data, f, default=lambda o: o.tolist())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _rank_path(directory: str, rank: int, epoch: int) -> str:
+    return os.path.join(directory, f"rank{rank}.{epoch % 2}.json")
+
+
+def save_checkpoint(comm, directory: str, epoch: int, progress: dict, rngs: list, run: dict):
+    """Collectively write checkpoint `epoch` for every rank of `comm`.
+
+    `progress` is this rank's counters, `rngs` its generators and `run`
+    the settings a restart must match (the same on every rank).
+    """
+    rank = comm.Get_rank()
+    _write_json(_rank_path(directory, rank, epoch), {
+        "epoch": epoch,
+        "rank": rank,
+        **progress,
+        "rng_states": [rng.bit_generator.state for rng in rngs],
+    })
+    # The manifest only moves on once every rank's file is safely on disk
+    comm.Barrier()
+    if rank == 0:
+        _write_json(os.path.join(directory, MANIFEST), {
+            "epoch": epoch,
+            "size": comm.Get_size(),
+            **run,
+        })
+
+
+def load_checkpoint(comm, directory: str, run: dict):
+    """Load this rank's part of the last consistent checkpoint.
+
+    Returns `(epoch, progress, rngs)`, or None when there is no checkpoint
+    to resume from. Raises ValueError if the checkpoint was written by a
+    run with different settings or a different number of ranks.
+    """
+    manifest = None
+    if comm.Get_rank() == 0:
+        path = os.path.join(directory, MANIFEST)
+        if os.path.exists(path):
+            with open(path) as f:
+                manifest = json.load(f)
+    manifest = comm.bcast(manifest, root=0)
+    if manifest is None:
+        return None
+
+    expected = {"size": comm.Get_size(), **run}
+    mismatched = [key for key, value in expected.items() if manifest.get(key) != value]
+    if mismatched:
+        raise ValueError(f"checkpoint in {directory} does not match this run: {mismatched}")
+
+    epoch = manifest["epoch"]
+    with open(_rank_path(directory, comm.Get_rank(), epoch)) as f:
+        data = json.load(f)
+    if data["epoch"] != epoch:
+        raise ValueError(f"rank {comm.Get_rank()} checkpoint is at epoch {data['epoch']}, expected {epoch}")
+
+    rngs = []
+    for state in data.pop("rng_states"):
+        bit_generator = getattr(np.random, state["bit_generator"])()
+        bit_generator.state = state
+        rngs.append(np.random.Generator(bit_generator))
+    del data["epoch"], data["rank"]
+    return epoch, data, rngs
@@ -4,22 +4,334 @@ MPI Code Challenge: SOLUTION
 
 This is the completed solution for the Monte Carlo Pi calculation.
 
+Points are drawn in fixed-size NumPy chunks and counted with one
+vectorized comparison per chunk, so memory stays bounded no matter
+how large the run is. Passing --seed makes a run reproducible: the root
+seed is spawned into one independent Philox stream per rank, so the same
+seed and process count always give a bit-identical estimate.
+
+With --schedule dynamic, rank 0 becomes a master that hands out chunks
+on demand and the other ranks pull more work as soon as they finish, so
+faster nodes simply end up doing more chunks.
+
+With --target-width, --points becomes an upper budget: ranks periodically
+combine their running hit counts with a non-blocking Iallreduce and all
+stop together once the confidence interval for Pi is narrow enough.
+
+Local compute and the final reduction are timed separately with
+MPI.Wtime; --json prints the whole result as one JSON record, which is
+what benchmark.py collects.
+
+With --threads N each rank splits its points over N threads, each with
+its own generator. NumPy releases the GIL while drawing and comparing
+large arrays, so one rank per node or socket can keep every core busy.
+
+The stream seeding and work splitting live in montecarlo.py, which also
+has a general-purpose distributed integrator built from the same pieces.
+--sampling picks one of its variance-reduction strategies (stratified,
+antithetic, or scrambled Sobol'/Halton) in place of plain uniform points;
+python montecarlo.py prints the error each one achieves per sample count.
+
+With --checkpoint-dir, ranks work through their share in lockstep rounds
+of one chunk and write a coordinated checkpoint (progress plus generator
+state, see checkpoint.py) every --checkpoint-every rounds. After a crash
+or preemption, rerunning the same command with --restart resumes from the
+last complete checkpoint instead of starting over.
+
 Run with: mpirun -n 4 python solution.py
+          mpirun -n 4 python solution.py --points 1_000_000_000 --chunk-size 4_000_000
+          mpirun -n 4 python solution.py --seed 12345
+          mpirun -n 4 python solution.py --schedule dynamic
+          mpirun -n 4 python solution.py --points 1_000_000_000 --target-width 1e-4
+          mpirun -n 2 python solution.py --threads 8
+          mpirun -n 4 python solution.py --sampling sobol
+          mpirun -n 4 python solution.py --points 10_000_000_000 --checkpoint-dir ckpt --restart
 """
 
 from mpi4py import MPI
-import random
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import json
+import math
+import os
+from statistics import NormalDist
+import numpy as np
+
+from checkpoint import load_checkpoint, save_checkpoint
+from montecarlo import (
+    CHUNK_SIZE, SAMPLING_METHODS, make_generator, sample_unit_points, split_points,
+)
 
 # Total number of random points to generate (across all processes)
 TOTAL_POINTS = 1_000_000
 
+# Message tags used by the dynamic (master/worker) scheduler
+TAG_REQUEST = 1
+TAG_WORK = 2
+TAG_STOP = 3
+
 
-def is_inside_circle(x: float, y: float) -> bool:
-    """Check if a point (x, y) is inside the quarter circle of radius 1."""
+def is_inside_circle(x, y):
+    """Check if point(s) (x, y) are inside the quarter circle of radius 1.
+
+    Works on plain floats or element-wise on NumPy arrays.
+    """
     return x * x + y * y <= 1
 
 
-def main():
+def count_hits(num_points: int, chunk_size: int = CHUNK_SIZE, rng=None) -> int:
+    """Count how many of `num_points` random points land inside the circle.
+
+    Points are generated `chunk_size` at a time, so peak memory is
+    O(chunk_size) rather than O(num_points).
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    rng = np.random.default_rng() if rng is None else rng
+
+    hits = 0
+    remaining = num_points
+    while remaining > 0:
+        n = min(chunk_size, remaining)
+        # Draw (x, y) pairs interleaved so the stream of points does not
+        # depend on the chunk size.
+        points = rng.random((n, 2))
+        hits += int(np.count_nonzero(is_inside_circle(points[:, 0], points[:, 1])))
+        remaining -= n
+    return hits
+
+
+def count_hits_sampled(comm, sampling: str, total_points: int, chunk_size: int,
+                       rng, seed=None) -> tuple:
+    """Count hits over this rank's share of `sampling` points.
+
+    Returns `(hits, points)`. Stratified and antithetic sampling round the
+    budget down to whole cells or pairs, so `points` can be slightly fewer
+    than this rank's share of `total_points`.
+    """
+    hits = 0
+    points = 0
+    for chunk in sample_unit_points(sampling, total_points, 2, comm, rng, seed, chunk_size):
+        hits += int(np.count_nonzero(is_inside_circle(chunk[:, 0], chunk[:, 1])))
+        points += len(chunk)
+    return hits, points
+
+
+def thread_generators(seed, stream: int, threads: int, jump: int = 0) -> list:
+    """One generator per thread for `stream`.
+
+    A single thread uses the stream itself, so --threads 1 reproduces the
+    plain single-threaded results exactly.
+    """
+    if threads == 1:
+        return [make_generator(seed, stream, jump)]
+    return [make_generator(seed, stream, jump, substream=t) for t in range(threads)]
+
+
+def count_hits_threaded(num_points: int, chunk_size: int, rngs: list, executor=None) -> int:
+    """Split `num_points` over one thread per generator and add up the hits.
+
+    Each thread draws its own `chunk_size` batches, so peak memory is
+    O(threads * chunk_size).
+    """
+    if executor is None or len(rngs) == 1:
+        return count_hits(num_points, chunk_size, rngs[0])
+    shares = [split_points(num_points, len(rngs), t) for t in range(len(rngs))]
+    return sum(executor.map(
+        lambda share, rng: count_hits(share, chunk_size, rng), shares, rngs,
+    ))
+
+
+def dispatch_chunks(comm, total_points: int, chunk_size: int) -> list:
+    """Master loop (rank 0): hand out chunks until all points are assigned.
+
+    Workers ask for work with TAG_REQUEST and get back either
+    `(chunk_index, num_points)` with TAG_WORK or TAG_STOP once nothing is
+    left. Returns the number of chunks served to each rank.
+    """
+    size = comm.Get_size()
+    chunks_per_rank = [0] * size
+    next_point = 0
+    next_chunk = 0
+    active_workers = size - 1
+    status = MPI.Status()
+
+    while active_workers > 0:
+        comm.recv(source=MPI.ANY_SOURCE, tag=TAG_REQUEST, status=status)
+        worker = status.Get_source()
+        if next_point < total_points:
+            n = min(chunk_size, total_points - next_point)
+            comm.send((next_chunk, n), dest=worker, tag=TAG_WORK)
+            chunks_per_rank[worker] += 1
+            next_point += n
+            next_chunk += 1
+        else:
+            comm.send(None, dest=worker, tag=TAG_STOP)
+            active_workers -= 1
+
+    return chunks_per_rank
+
+
+def work_on_chunks(comm, chunk_size: int, seed=None, threads: int = 1, executor=None) -> int:
+    """Worker loop: keep pulling chunks from rank 0 until told to stop.
+
+    Chunk `i` is sampled from stream 0 jumped ahead `i` times, so with a
+    seed the estimate does not depend on which rank ran which chunk.
+    """
+    hits = 0
+    status = MPI.Status()
+    while True:
+        comm.send(None, dest=0, tag=TAG_REQUEST)
+        work = comm.recv(source=0, tag=MPI.ANY_TAG, status=status)
+        if status.Get_tag() == TAG_STOP:
+            return hits
+        chunk_index, n = work
+        rngs = thread_generators(seed, 0, threads, jump=chunk_index)
+        hits += count_hits_threaded(n, chunk_size, rngs, executor)
+
+
+def pi_interval_width(hits: int, points: int, confidence: float) -> float:
+    """Full width of the normal-approximation confidence interval for Pi.
+
+    Each point is a Bernoulli trial with p = Pi/4, so the standard error of
+    4 * hits / points is 4 * sqrt(p(1 - p) / points).
+    """
+    p = hits / points
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    return 2 * z * 4 * math.sqrt(p * (1 - p) / points)
+
+
+def converge_hits(comm, max_points: int, chunk_size: int, rngs: list,
+                  target_width: float, confidence: float, executor=None) -> tuple:
+    """Sample chunk by chunk until the global interval is narrow enough.
+
+    After every chunk each rank posts its running `(hits, points,
+    remaining)` totals in an Iallreduce and samples the next chunk while
+    the reduction is in flight. Every rank sees the same reduced totals,
+    so they all make the same stop decision on the same iteration.
+    Returns this rank's `(hits, points)`.
+    """
+    hits = 0
+    points = 0
+    snapshot = np.zeros(3, dtype=np.int64)
+    totals = np.zeros(3, dtype=np.int64)
+    request = None
+
+    while True:
+        n = min(chunk_size, max_points - points)
+        if n > 0:
+            hits += count_hits_threaded(n, chunk_size, rngs, executor)
+            points += n
+
+        if request is not None:
+            request.Wait()
+            total_hits, total_points, remaining = (int(v) for v in totals)
+            if remaining == 0:
+                break
+            if 0 < total_hits < total_points and \
+                    pi_interval_width(total_hits, total_points, confidence) <= target_width:
+                break
+
+        snapshot[:] = (hits, points, max_points - points)
+        request = comm.Iallreduce(snapshot, totals, op=MPI.SUM)
+
+    return hits, points
+
+
+def checkpointed_hits(comm, num_points: int, chunk_size: int, rngs: list,
+                      directory: str, every: int, restart: bool, run: dict,
+                      executor=None) -> tuple:
+    """Static sampling with a coordinated checkpoint every `every` rounds.
+
+    Each round draws one chunk. Every rank runs the same number of rounds
+    (a rank with a smaller share draws nothing in its last round), so all
+    ranks reach each checkpoint together. Returns `(hits, resumed_epoch)`,
+    where `resumed_epoch` is None for a fresh run.
+    """
+    rounds = -(-comm.allreduce(num_points, op=MPI.MAX) // chunk_size)
+    epoch = 0
+    resumed_epoch = None
+    progress = {"rounds": 0, "points": 0, "hits": 0}
+    if restart:
+        resumed = load_checkpoint(comm, directory, run)
+        if resumed is not None:
+            epoch, progress, rngs = resumed
+            resumed_epoch = epoch
+    os.makedirs(directory, exist_ok=True)
+
+    while progress["rounds"] < rounds:
+        n = min(chunk_size, num_points - progress["points"])
+        if n > 0:
+            progress["hits"] += count_hits_threaded(n, chunk_size, rngs, executor)
+            progress["points"] += n
+        progress["rounds"] += 1
+        if progress["rounds"] % every == 0 and progress["rounds"] < rounds:
+            epoch += 1
+            save_checkpoint(comm, directory, epoch, progress, rngs, run)
+
+    return progress["hits"], resumed_epoch
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Distributed Monte Carlo Pi estimate")
+    parser.add_argument("--points", type=int, default=TOTAL_POINTS,
+                        help="total number of points across all processes")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="points drawn per vectorized batch")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="root seed for reproducible per-rank random streams")
+    parser.add_argument("--schedule", choices=["static", "dynamic"], default="static",
+                        help="static equal shares, or rank 0 handing out chunks on demand")
+    parser.add_argument("--target-width", type=float, default=None,
+                        help="stop early once the confidence interval for Pi is this wide")
+    parser.add_argument("--confidence", type=float, default=0.95,
+                        help="confidence level used with --target-width")
+    parser.add_argument("--sampling", choices=SAMPLING_METHODS, default="uniform",
+                        help="how sample points are placed in the unit square")
+    parser.add_argument("--checkpoint-dir", default=None,
+                        help="directory for periodic checkpoints")
+    parser.add_argument("--checkpoint-every", type=int, default=10,
+                        help="chunks per rank between checkpoints")
+    parser.add_argument("--restart", action="store_true",
+                        help="resume from the last checkpoint in --checkpoint-dir")
+    parser.add_argument("--json", action="store_true",
+                        help="print the result as a single JSON record")
+    parser.add_argument("--threads", type=int, default=1,
+                        help="sampling threads per rank")
+    args = parser.parse_args(argv)
+    if args.points < 1:
+        parser.error("--points must be positive")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be positive")
+    if args.seed is not None and args.seed < 0:
+        parser.error("--seed must be non-negative")
+    if args.target_width is not None:
+        if args.target_width <= 0:
+            parser.error("--target-width must be positive")
+        if args.schedule == "dynamic":
+            parser.error("--target-width only supports --schedule static")
+    if not 0 < args.confidence < 1:
+        parser.error("--confidence must be between 0 and 1")
+    if args.threads < 1:
+        parser.error("--threads must be positive")
+    if args.sampling != "uniform":
+        if args.schedule == "dynamic" or args.target_width is not None or args.threads > 1:
+            parser.error("--sampling other than uniform only supports the plain static run")
+        if args.sampling == "antithetic" and args.points < 2:
+            parser.error("--sampling antithetic needs --points of at least 2 (one pair)")
+    if args.checkpoint_every < 1:
+        parser.error("--checkpoint-every must be positive")
+    if args.restart and args.checkpoint_dir is None:
+        parser.error("--restart needs --checkpoint-dir")
+    if args.checkpoint_dir is not None:
+        if args.schedule == "dynamic" or args.target_width is not None or args.sampling != "uniform":
+            parser.error("--checkpoint-dir only supports the plain static run")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     # ===========================================
     # TODO 1: Initialize MPI
     # Get the communicator, rank, and size
@@ -32,36 +344,115 @@ def main():
     # TODO 2: Calculate how many points this process should generate
     # Divide the work evenly among all processes
     # ===========================================
-    points_per_process = TOTAL_POINTS // size
+    dynamic = args.schedule == "dynamic" and size > 1
+    chunks_per_rank = None
+    resumed_epoch = None
 
     # ===========================================
     # TODO 3: Generate random points and count hits
     # A "hit" is when the point falls inside the quarter circle
     # ===========================================
-    local_hits = 0
+    executor = ThreadPoolExecutor(args.threads) if args.threads > 1 else None
+
+    comm.Barrier()
+    compute_start = MPI.Wtime()
+
+    if dynamic and rank == 0:
+        chunks_per_rank = dispatch_chunks(comm, args.points, args.chunk_size)
+        local_hits = 0
+    elif dynamic:
+        local_hits = work_on_chunks(comm, args.chunk_size, args.seed,
+                                    args.threads, executor)
+    elif args.sampling != "uniform":
+        rng = make_generator(args.seed, rank)
+        local_hits, local_points = count_hits_sampled(
+            comm, args.sampling, args.points, args.chunk_size, rng, args.seed,
+        )
+    elif args.checkpoint_dir is not None:
+        points_per_process = split_points(args.points, size, rank)
+        rngs = thread_generators(args.seed, rank, args.threads)
+        # A restart must use the same settings the checkpoint was written with
+        run = {"points": args.points, "chunk_size": args.chunk_size,
+               "threads": args.threads, "seed": args.seed}
+        local_hits, resumed_epoch = checkpointed_hits(
+            comm, points_per_process, args.chunk_size, rngs, args.checkpoint_dir,
+            args.checkpoint_every, args.restart, run, executor,
+        )
+    elif args.target_width is not None:
+        points_per_process = split_points(args.points, size, rank)
+        rngs = thread_generators(args.seed, rank, args.threads)
+        local_hits, local_points = converge_hits(
+            comm, points_per_process, args.chunk_size, rngs,
+            args.target_width, args.confidence, executor,
+        )
+    else:
+        points_per_process = split_points(args.points, size, rank)
+        rngs = thread_generators(args.seed, rank, args.threads)
+        local_hits = count_hits_threaded(points_per_process, args.chunk_size, rngs, executor)
 
-    for _ in range(points_per_process):
-        x = random.random()
-        y = random.random()
-        if is_inside_circle(x, y):
-            local_hits += 1
+    compute_time = MPI.Wtime() - compute_start
+    if executor is not None:
+        executor.shutdown()
 
     # ===========================================
     # TODO 4: Use MPI to sum up all local_hits from every process
     # The result should only be stored on rank 0
     # ===========================================
+    reduce_start = MPI.Wtime()
     total_hits = comm.reduce(local_hits, op=MPI.SUM, root=0)
+    reduce_time = MPI.Wtime() - reduce_start
+
+    # The slowest rank sets the wall time, so report the maximum
+    compute_time = comm.reduce(compute_time, op=MPI.MAX, root=0)
+    reduce_time = comm.reduce(reduce_time, op=MPI.MAX, root=0)
+
+    if args.target_width is not None or args.sampling != "uniform":
+        total_points = comm.reduce(local_points, op=MPI.SUM, root=0)
+    else:
+        total_points = args.points
 
     # ===========================================
     # TODO 5: Calculate and print Pi (only on rank 0)
     # Remember: Pi ≈ 4 * (hits inside circle) / (total points)
     # ===========================================
     if rank == 0:
-        total_points = points_per_process * size
         pi_estimate = 4.0 * total_hits / total_points
+        if args.json:
+            print(json.dumps({
+                "pi_estimate": pi_estimate,
+                "error": abs(pi_estimate - math.pi),
+                "total_points": total_points,
+                "ranks": size,
+                "threads": args.threads,
+                "schedule": args.schedule,
+                "sampling": args.sampling,
+                "chunk_size": args.chunk_size,
+                "seed": args.seed,
+                "compute_time_s": compute_time,
+                "reduce_time_s": reduce_time,
+                "chunks_per_rank": chunks_per_rank,
+                "resumed_epoch": resumed_epoch,
+            }))
+            return
+
         print(f"Estimated Pi = {pi_estimate:.6f} (using {total_points:,} total points across {size} processes)")
         print(f"Actual Pi    = 3.141593...")
         print(f"Error        = {abs(pi_estimate - 3.141592653589793):.6f}")
+        if args.sampling != "uniform":
+            print(f"Sampling     = {args.sampling}")
+        if args.threads > 1:
+            print(f"Threads/rank = {args.threads}")
+        if args.seed is not None:
+            print(f"Seed         = {args.seed}")
+        if args.target_width is not None:
+            width = pi_interval_width(total_hits, total_points, args.confidence)
+            print(f"CI width     = {width:.6f} at {args.confidence:.0%} "
+                  f"(target {args.target_width:g}, budget {args.points:,} points)")
+        if chunks_per_rank is not None:
+            print(f"Chunks/rank  = {chunks_per_rank} (rank 0 only dispatches)")
+        if resumed_epoch is not None:
+            print(f"Restarted    = from checkpoint epoch {resumed_epoch} in {args.checkpoint_dir}")
+        print(f"Time         = {compute_time:.3f} s compute + {reduce_time:.6f} s reduce")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,198 @@
+"""
+Benchmarks for Task A and Task B
+================================
+
+pytest-benchmark suite for the solutions' hot spots: projectile
+simulation, optimal-angle search, and the pendulum trial reductions, at
+problem sizes from the 19 trials in ALL_DATA up to a million synthetic
+ones.
+
+Each size is its own benchmark, so grouping by function gives a scaling
+curve per function. Baselines are saved runs; comparing against one
+fails the run when any benchmark got slower by more than the threshold.
+
+Run with: pytest benchmarks.py --benchmark-group-by=func
+          pytest benchmarks.py --benchmark-autosave              (store a baseline)
+          pytest benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:10%
+
+Set BENCH_MAX_TRIALS (e.g. BENCH_MAX_TRIALS=100000) to skip the largest
+trial counts on a quick run.
+"""
+
+import functools
+import math
+import os
+import random
+
+import pytest
+
+import task_a_oop as a
+import task_b_fp as b
+
+MAX_TRIALS = int(os.environ.get("BENCH_MAX_TRIALS", 1_000_000))
+
+TRIAL_COUNTS = [n for n in (len(b.ALL_DATA), 1_000, 100_000, 1_000_000) if n <= MAX_TRIALS]
+
+
+# ── Synthetic data ─────────────────────────────────────────
+
+LOCATIONS = ("Lab A", "Lab B", "Rooftop", "Basement", "Field")
+NOTES = ("clean", "clean", "clean", "door draft", "windy")
+
+
+@functools.lru_cache(maxsize=None)
+def synthetic_trials(n: int) -> tuple:
+    """`n` reproducible Trials: real ones first, then simulated rigs.
+
+    Periods follow T = 2π √(L / g) for g = 9.81 with 0.5% timing noise,
+    so the statistics stay realistic at every size.
+    """
+    if n <= len(b.ALL_DATA):
+        return tuple(b.ALL_DATA[:n])
+    rng = random.Random(n)
+    trials = list(b.ALL_DATA)
+    for trial_id in range(len(trials) + 1, n + 1):
+        length = rng.choice((0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0))
+        swings = rng.choice((5, 10, 20))
+        period = 2 * math.pi * math.sqrt(length / b.ACCEPTED_G)
+        total_time = round(swings * period * rng.gauss(1.0, 0.005), 2)
+        trials.append(b.Trial(trial_id, length, swings, total_time,
+                              rng.choice(LOCATIONS), rng.choice(NOTES)))
+    return tuple(trials)
+
+
+def sized(counts: list):
+    return pytest.mark.parametrize("n", counts, ids=[f"n={n}" for n in counts])
+
+
+# ── Task A: Projectile simulator ───────────────────────────
+
+PROJECTILES = [a.Baseball, a.Cannonball, a.GolfBall]
+
+
+@pytest.mark.parametrize("dt", [0.01, 0.001])
+@pytest.mark.parametrize("projectile_class", PROJECTILES, ids=lambda cls: cls.__name__)
+def test_simulate(benchmark, projectile_class, dt):
+    sim = a.Simulator(a.Earth(), dt=dt)
+    trajectory = benchmark(sim.simulate, projectile_class())
+    benchmark.extra_info["points"] = len(trajectory)
+
+
+@pytest.mark.parametrize("dt", [0.01, 0.001])
+def test_simulate_summary(benchmark, dt):
+    sim = a.Simulator(a.Moon(), dt=dt, solver="euler")
+    benchmark(sim.simulate_summary, a.Cannonball())
+
+
+def launches(n: int) -> list:
+    """`n` launches spread over speeds 20-100 m/s and angles 5-85°."""
+    return [a.Launch(f"launch {i}", 20 + 80 * (i % 9) / 8, 5 + 80 * (i % 17) / 16)
+            for i in range(n)]
+
+
+@sized([10, 100])
+def test_simulator_sweep(benchmark, n):
+    sims = [a.Simulator(planet, solver="euler") for planet in (a.Earth(), a.Mars())]
+    projectiles = launches(n)
+    benchmark(lambda: [sim.run(proj) for proj in projectiles for sim in sims])
+
+
+@sized([10, 100, 1_000])
+def test_batch_simulator(benchmark, n):
+    batch = a.BatchSimulator([a.Earth(), a.Mars()])
+    benchmark(batch.run, launches(n))
+
+
+@pytest.mark.parametrize("solver", ["auto", "euler"])
+@pytest.mark.parametrize("method", ["golden", "grid"])
+def test_find_optimal_angle(benchmark, method, solver):
+    angle, _ = benchmark(a.find_optimal_angle, a.Baseball, a.Earth(),
+                         method=method, solver=solver)
+    assert 40 < angle < 50
+
+
+# ── Task B: Pendulum analyzer ──────────────────────────────
+
+@sized(TRIAL_COUNTS)
+def test_trials_by_location(benchmark, n):
+    grouped = benchmark(b.trials_by_location, synthetic_trials(n))
+    assert sum(map(len, grouped.values())) == n
+
+
+@sized(TRIAL_COUNTS)
+def test_group_by_composite(benchmark, n):
+    benchmark(b.group_by(("location", "length_m")), synthetic_trials(n))
+
+
+@sized(TRIAL_COUNTS)
+def test_average_g(benchmark, n):
+    assert benchmark(b.average_g, synthetic_trials(n)) == pytest.approx(b.ACCEPTED_G, rel=0.05)
+
+
+@sized(TRIAL_COUNTS)
+def test_std_deviation_g(benchmark, n):
+    benchmark(b.std_deviation_g, synthetic_trials(n))
+
+
+@sized(TRIAL_COUNTS)
+def test_filter_pipeline(benchmark, n):
+    clean_only = b.create_filter(lambda t: t.notes == "clean")
+    indoor_only = b.create_filter(lambda t: t.location != "Rooftop")
+    pipeline = b.compose(b.average_g, clean_only, indoor_only)
+    benchmark(pipeline, synthetic_trials(n))
+
+
+@sized(TRIAL_COUNTS)
+def test_most_precise_location(benchmark, n):
+    benchmark(b.most_precise_location, synthetic_trials(n))
+
+
+@functools.lru_cache(maxsize=None)
+def synthetic_table(n: int):
+    return b.to_table(synthetic_trials(n))
+
+
+@sized(TRIAL_COUNTS)
+def test_to_table(benchmark, n):
+    benchmark(b.to_table, synthetic_trials(n))
+
+
+@sized(TRIAL_COUNTS)
+def test_table_g_stats_by(benchmark, n):
+    benchmark(b.table_g_stats_by, synthetic_table(n), "location")
+
+
+@sized(TRIAL_COUNTS)
+def test_table_filter_pipeline(benchmark, n):
+    clean_only = b.create_table_filter(b.field_equals("notes", "clean"))
+    indoor_only = b.create_table_filter(lambda tb: ~b.field_equals("location", "Rooftop")(tb))
+    pipeline = b.compose(b.table_g_stats, clean_only, indoor_only)
+    benchmark(pipeline, synthetic_table(n))
+
+
+@pytest.fixture(scope="module", params=["csv", "parquet"])
+def trial_file(request, tmp_path_factory):
+    """100,000 synthetic trials (or BENCH_MAX_TRIALS, if fewer) on disk."""
+    if request.param == "parquet":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path_factory.mktemp("trials") / f"trials.{request.param}")
+    b.write_trials(path, synthetic_trials(min(100_000, MAX_TRIALS)))
+    return path
+
+
+def test_read_trials_g_stats(benchmark, trial_file):
+    benchmark(lambda: b.g_stats(b.read_trials(trial_file)))
+
+
+def test_read_trial_tables_g_stats_by(benchmark, trial_file):
+    by_location = lambda table: b.table_g_stats_by(table, "location")
+    benchmark(lambda: functools.reduce(b.merge_stats_by,
+                                       map(by_location, b.read_trial_tables(trial_file))))
+
+
+@sized(TRIAL_COUNTS)
+def test_lazy_pipeline(benchmark, n):
+    clean_only = b.create_filter(lambda t: t.notes == "clean", lazy=True)
+    indoor_only = b.create_filter(lambda t: t.location != "Rooftop", lazy=True)
+    pipeline = b.pipeline(b.average_g, clean_only, indoor_only, reorder=True)
+    benchmark(pipeline, synthetic_trials(n))
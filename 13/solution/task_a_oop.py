@@ -6,15 +6,33 @@ Simulate projectile trajectories across different planets using
 Object-Oriented Programming and SOLID principles.
 
 Run with: python task_a_oop.py
+          python task_a_oop.py --perf    (also the performance extensions)
 """
 
 from abc import ABC, abstractmethod
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import csv
+import functools
+import json
 import math
+import os
+import shelve
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import NamedTuple
+
+import numpy as np
 
 
 # ── Provided: Vector2D (immutable) ─────────────────────────
 
 class Vector2D:
+    __slots__ = ("_x", "_y")
+
     def __init__(self, x: float, y: float):
         self._x = x
         self._y = y
@@ -43,9 +61,13 @@ class Vector2D:
 # ── TODO 1: Projectile ABC ────────────────────────────────
 
 class Projectile(ABC):
-    def __init__(self, launch_speed: float, launch_angle_deg: float):
+    def __init__(self, launch_speed: float, launch_angle_deg: float, mass_kg: float = None,
+                 diameter_m: float = None, drag_coefficient: float = 0.47):
         self._launch_speed = launch_speed
         self._launch_angle = launch_angle_deg
+        self._mass_kg = mass_kg
+        self._diameter_m = diameter_m
+        self._drag_coefficient = drag_coefficient
         angle_rad = math.radians(launch_angle_deg)
         self._initial_velocity = Vector2D(
             launch_speed * math.cos(angle_rad),
@@ -69,12 +91,29 @@ class Projectile(ABC):
     def initial_velocity(self) -> Vector2D:
         return self._initial_velocity
 
+    @property
+    def mass_kg(self) -> float:
+        return self._mass_kg
+
+    @property
+    def diameter_m(self) -> float:
+        return self._diameter_m
+
+    @property
+    def cross_section_m2(self) -> float:
+        return math.pi * self._diameter_m ** 2 / 4
+
+    @property
+    def drag_coefficient(self) -> float:
+        return self._drag_coefficient
+
 
 # ── TODO 2: Concrete Projectiles ──────────────────────────
 
 class Baseball(Projectile):
     def __init__(self):
-        super().__init__(launch_speed=40.0, launch_angle_deg=45.0)
+        super().__init__(launch_speed=40.0, launch_angle_deg=45.0,
+                         mass_kg=0.145, diameter_m=0.074, drag_coefficient=0.35)
 
     @property
     def name(self) -> str:
@@ -83,7 +122,8 @@ class Baseball(Projectile):
 
 class Cannonball(Projectile):
     def __init__(self):
-        super().__init__(launch_speed=100.0, launch_angle_deg=35.0)
+        super().__init__(launch_speed=100.0, launch_angle_deg=35.0,
+                         mass_kg=5.0, diameter_m=0.107, drag_coefficient=0.47)
 
     @property
     def name(self) -> str:
@@ -92,7 +132,8 @@ class Cannonball(Projectile):
 
 class GolfBall(Projectile):
     def __init__(self):
-        super().__init__(launch_speed=70.0, launch_angle_deg=30.0)
+        super().__init__(launch_speed=70.0, launch_angle_deg=30.0,
+                         mass_kg=0.046, diameter_m=0.0427, drag_coefficient=0.25)
 
     @property
     def name(self) -> str:
@@ -148,34 +189,345 @@ class Mars(GravityModel):
 
 # ── TODO 4: Simulator ─────────────────────────────────────
 
+class Trajectory:
+    """Flight samples stored in contiguous float arrays.
+
+    Behaves like the original list of `(t, Vector2D)` tuples (indexing,
+    iteration, `len` and `append`), but a sample costs 24 bytes, or 40
+    with velocities, and `Vector2D` objects are only built when a sample is
+    read. `times`, `xs`, `ys`, `vxs` and `vys` return NumPy arrays for
+    vectorized analysis.
+    """
+
+    __slots__ = ("_t", "_x", "_y", "_vx", "_vy")
+
+    def __init__(self, record_velocity: bool = False):
+        self._t = array("d")
+        self._x = array("d")
+        self._y = array("d")
+        self._vx = array("d") if record_velocity else None
+        self._vy = array("d") if record_velocity else None
+
+    @classmethod
+    def from_samples(cls, samples) -> "Trajectory":
+        """Build from an iterable of `(t, Vector2D)` tuples."""
+        trajectory = cls()
+        for t, pos in samples:
+            trajectory.record(t, pos)
+        return trajectory
+
+    @property
+    def has_velocity(self) -> bool:
+        return self._vx is not None
+
+    def record(self, t: float, pos: Vector2D, vel: Vector2D = None):
+        # Called once per step, so read the slots directly
+        self._t.append(t)
+        self._x.append(pos._x)
+        self._y.append(pos._y)
+        if self._vx is not None:
+            self._vx.append(vel._x)
+            self._vy.append(vel._y)
+
+    def append(self, sample: tuple):
+        self.record(*sample)
+
+    def __len__(self) -> int:
+        return len(self._t)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return self._t[index], Vector2D(self._x[index], self._y[index])
+
+    def __iter__(self):
+        for t, x, y in zip(self._t, self._x, self._y):
+            yield t, Vector2D(x, y)
+
+    def velocity(self, index: int) -> Vector2D:
+        return Vector2D(self._vx[index], self._vy[index])
+
+    @property
+    def times(self) -> np.ndarray:
+        return np.array(self._t)
+
+    @property
+    def xs(self) -> np.ndarray:
+        return np.array(self._x)
+
+    @property
+    def ys(self) -> np.ndarray:
+        return np.array(self._y)
+
+    @property
+    def vxs(self) -> np.ndarray:
+        return np.array(self._vx)
+
+    @property
+    def vys(self) -> np.ndarray:
+        return np.array(self._vy)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of sample data held."""
+        columns = [self._t, self._x, self._y, self._vx, self._vy]
+        return sum(len(c) * c.itemsize for c in columns if c is not None)
+
+
+# Safety cap on simulated time, in case a projectile never comes down
+MAX_FLIGHT_TIME_S = 10000
+
+SOLVERS = ("auto", "analytic", "euler")
+
+
+def _instrumented(method):
+    """Route a Simulator method through its `Instrumentation`, if any.
+
+    Without instrumentation this costs one extra call per simulation and
+    nothing per step.
+    """
+    @functools.wraps(method)
+    def wrapper(self, projectile, *args, **kwargs):
+        if self._instrumentation is None:
+            return method(self, projectile, *args, **kwargs)
+        return self._instrumentation.measure(method, self, projectile, *args, **kwargs)
+    return wrapper
+
+
 class Simulator:
-    def __init__(self, gravity_model: GravityModel, dt: float = 0.01):
+    def __init__(self, gravity_model: GravityModel, dt: float = 0.01, solver: str = "auto",
+                 integrator: "Integrator" = None, locate_events: bool = None,
+                 cache: "SimulationCache" = None, forces: list = (),
+                 instrumentation: "Instrumentation" = None):
+        if solver not in SOLVERS:
+            raise ValueError(f"unknown solver {solver!r}, expected one of {SOLVERS}")
         self._gravity = gravity_model
         self._dt = dt
+        self._solver = solver
+        # Semi-implicit Euler is the original update: velocity first, then
+        # position with the new velocity
+        self._integrator = SemiImplicitEuler() if integrator is None else integrator
+        # Other integrators are not calibrated against the stepped flight, so
+        # they end on the located impact rather than one step below ground
+        if locate_events is None:
+            locate_events = not isinstance(self._integrator, SemiImplicitEuler)
+        if self._integrator.adaptive and not locate_events:
+            raise ValueError(f"{self._integrator.name} needs locate_events: its steps "
+                             "can overshoot the ground by an unbounded distance")
+        self._locate_events = locate_events
+        self._cache = cache
+        self._forces = tuple(forces)
+        self._instrumentation = instrumentation
+
+    @property
+    def cache(self) -> "SimulationCache":
+        return self._cache
+
+    @property
+    def instrumentation(self) -> "Instrumentation":
+        return self._instrumentation
+
+    def describe(self) -> dict:
+        """The settings a measurement or report should be labelled with."""
+        return {
+            "gravity": self._gravity.name,
+            "integrator": self._integrator.name,
+            "dt": self._dt,
+            "forces": len(self._forces),
+        }
+
+    def cache_key(self, projectile: Projectile) -> tuple:
+        """Everything a stepped flight depends on, as plain values.
+
+        Two simulators built from different objects share cache entries
+        as long as the launch velocity, gravity, time step and integrator
+        settings are equal. With forces, the forces and the projectile's
+        `Body` are part of the key too.
+        """
+        vel = projectile.initial_velocity
+        acc = self._gravity.acceleration()
+        integrator = self._integrator
+        key = (
+            vel.x, vel.y, acc.x, acc.y, self._dt,
+            type(integrator).__name__, tuple(sorted(vars(integrator).items())),
+            self._locate_events,
+        )
+        if self._forces:
+            key += (tuple(map(repr, self._forces)), Body.of(projectile))
+        return key
 
-    def simulate(self, projectile: Projectile) -> list:
+    @property
+    def has_closed_form(self) -> bool:
+        """True when the exact vacuum solution applies.
+
+        That is the case when the gravity model keeps the constant, downward
+        `GravityModel.acceleration()` and no other forces act.
+        """
+        return (
+            not self._forces
+            and type(self._gravity).acceleration is GravityModel.acceleration
+            and self._gravity.acceleration().y < 0
+        )
+
+    def run(self, projectile: Projectile) -> dict:
+        """Summarize a flight without the caller handling the trajectory.
+
+        The "auto" solver uses the O(1) closed form whenever
+        `has_closed_form` holds and falls back to Euler steps otherwise;
+        "euler" always steps and "analytic" insists on the closed form.
+        """
+        if self._solver == "euler" or (self._solver == "auto" and not self.has_closed_form):
+            return self.simulate_summary(projectile)
+        if not self.has_closed_form:
+            raise ValueError(f"{self._gravity.name} has no closed-form solution")
+        return self.analytic_summary(projectile)
+
+    def analytic_summary(self, projectile: Projectile) -> dict:
+        """Exact max height, range and flight time under constant gravity.
+
+        Launching from and landing at y = 0 with acceleration (ax, ay):
+          T = -2 vy / ay,   H = vy² / (-2 ay),   R = vx T + ½ ax T²
+        """
+        acc = self._gravity.acceleration()
+        vel = projectile.initial_velocity
+        vy = max(vel.y, 0.0)
+        flight_time = -2 * vy / acc.y
+        return {
+            "name": projectile.name,
+            "max_height_m": vy ** 2 / (-2 * acc.y),
+            "range_m": vel.x * flight_time + 0.5 * acc.x * flight_time ** 2,
+            "flight_time_s": flight_time,
+        }
+
+    def _steps(self, projectile: Projectile):
+        """Yield (t, pos, vel) for every sample of the flight, in order.
+
+        With `locate_events`, the apex and the ground impact are found by
+        root-finding inside the step where they happen, so the flight ends
+        exactly at y = 0 instead of one step below it.
+        """
         pos = Vector2D(0.0, 0.0)
         vel = projectile.initial_velocity
         acc = self._gravity.acceleration()
+        accel = lambda p, v: acc
+        if self._forces:
+            accel = self._force_accel(acc, Body.of(projectile))
+        integrator = self._integrator
         t = 0.0
-        trajectory = [(t, pos)]
+        dt = self._dt
+        yield t, pos, vel
 
         while pos.y >= 0 or t < self._dt:
-            vel = vel.add(acc.scale(self._dt))
-            pos = pos.add(vel.scale(self._dt))
-            t += self._dt
-            trajectory.append((t, pos))
-
-            if t > 10000:
-                break
-
+            new_pos, new_vel, used, dt = integrator.advance(pos, vel, dt, accel)
+
+            if self._locate_events:
+                step_to = lambda s: integrator.step(pos, vel, s, accel)
+                if vel.y > 0 >= new_vel.y:
+                    apex = find_root(lambda s: step_to(s)[1].y, used)
+                    yield (t + apex, *step_to(apex))
+                if new_pos.y < 0:
+                    impact = find_root(lambda s: step_to(s)[0].y, used)
+                    yield (t + impact, *step_to(impact))
+                    return
+
+            pos, vel = new_pos, new_vel
+            t += used
+            yield t, pos, vel
+
+            if t > MAX_FLIGHT_TIME_S:
+                return
+
+    def _force_accel(self, acc: Vector2D, body: "Body"):
+        """Acceleration function adding every force to gravity.
+
+        Forces take scalars here, which NumPy broadcasts like length-1
+        arrays, so one step costs a few ufunc calls and no array building.
+        """
+        forces = self._forces
+
+        def accel(p, v):
+            ax, ay = acc._x, acc._y
+            for force in forces:
+                fx, fy = force.acceleration(p._x, p._y, v._x, v._y, body)
+                ax += fx
+                ay += fy
+            return Vector2D(float(ax), float(ay))
+
+        return accel
+
+    def _samples(self, projectile: Projectile):
+        """`_steps`, counted when instrumentation is on."""
+        samples = self._steps(projectile)
+        if self._instrumentation is not None:
+            samples = self._instrumentation.counted(samples)
+        return samples
+
+    @_instrumented
+    def simulate(self, projectile: Projectile, record_velocity: bool = False) -> Trajectory:
+        """Step the flight with the integrator until it hits the ground."""
+        trajectory = Trajectory(record_velocity)
+        for t, pos, vel in self._samples(projectile):
+            trajectory.record(t, pos, vel)
         return trajectory
 
+    def stream(self, projectile: Projectile, every: int = 1):
+        """Yield (t, Vector2D) samples without storing the trajectory.
+
+        Only every `every`-th sample is yielded, plus the landing point, so
+        a plot can be drawn at lower resolution than the integration runs.
+        """
+        if every < 1:
+            raise ValueError(f"every must be positive, got {every}")
+        sample = None
+        for i, (t, pos, _) in enumerate(self._steps(projectile)):
+            sample = (t, pos)
+            if i % every == 0:
+                yield sample
+                sample = None
+        if sample is not None:
+            yield sample
+
+    @_instrumented
+    def simulate_summary(self, projectile: Projectile) -> dict:
+        """Integrate and summarize in one pass, in O(1) memory.
+
+        Gives the same dict as `summarize(projectile, simulate(projectile))`
+        without keeping a single trajectory sample. With a `cache`, flights
+        already integrated with the same `cache_key` are not stepped again.
+        """
+        key = None
+        if self._cache is not None:
+            key = self.cache_key(projectile)
+            cached = self._cache.get(key)
+            if cached is not None:
+                max_height, range_x, t = cached
+                return {
+                    "name": projectile.name,
+                    "max_height_m": max_height,
+                    "range_m": range_x,
+                    "flight_time_s": t,
+                }
+
+        max_height = 0.0
+        for t, pos, _ in self._samples(projectile):
+            if pos.y > max_height:
+                max_height = pos.y
+        if key is not None:
+            self._cache.put(key, (max_height, pos.x, t))
+        return {
+            "name": projectile.name,
+            "max_height_m": max_height,
+            "range_m": pos.x,
+            "flight_time_s": t,
+        }
+
     @staticmethod
-    def summarize(projectile: Projectile, trajectory: list) -> dict:
-        max_height = max(p.y for _, p in trajectory)
-        range_x = trajectory[-1][1].x
-        flight_time = trajectory[-1][0]
+    def summarize(projectile: Projectile, trajectory: Trajectory) -> dict:
+        if not isinstance(trajectory, Trajectory):
+            trajectory = Trajectory.from_samples(trajectory)
+        max_height = float(trajectory.ys.max())
+        flight_time, last = trajectory[-1]
+        range_x = last.x
         return {
             "name": projectile.name,
             "max_height_m": max_height,
@@ -200,8 +552,7 @@ def demo():
         print(f"  {'—' * 56}")
 
         for proj in projectiles:
-            trajectory = sim.simulate(proj)
-            result = Simulator.summarize(proj, trajectory)
+            result = sim.simulate_summary(proj)
             print(
                 f"    {result['name']:12s} | "
                 f"Height: {result['max_height_m']:8.1f} m | "
@@ -229,15 +580,9 @@ class Jupiter(GravityModel):
 
 
 # ── EXT 2: Mass + launch energy ────────────────────────────
-# NOTE: This requires modifying the Projectile ABC above to add:
-#
-#   @property
-#   @abstractmethod
-#   def mass_kg(self) -> float:
-#       pass
-#
-# And implementing mass_kg in Baseball (0.145), Cannonball (5.0),
-# GolfBall (0.046). Then use this function:
+# The Projectile ABC carries mass_kg: Baseball (0.145), Cannonball (5.0),
+# GolfBall (0.046). Diameter and drag coefficient sit alongside it for
+# the force models in PERF 8.
 
 def launch_energy(projectile):
     """KE = 0.5 * m * v²"""
@@ -246,18 +591,37 @@ def launch_energy(projectile):
 
 # ── EXT 3: Optimal angle finder ────────────────────────────
 
-def find_optimal_angle(projectile_class, planet, mass_kg=None):
-    """Test angles 10-80° and find the one giving max range."""
+def find_optimal_angle(projectile_class, planet, mass_kg=None,
+                       method: str = "golden", tol: float = 0.01, solver: str = "auto",
+                       cache: "SimulationCache" = None, forces: list = ()):
+    """Find the launch angle giving max range.
+
+    "golden" runs a golden-section search over 0-90° down to `tol`
+    degrees; range is unimodal in angle, so about 20 evaluations are
+    enough. "grid" is the original scan of 10-80° in 5° steps. `solver`,
+    `cache` and `forces` are passed to `Simulator`, so vacuum flights use
+    the closed form and repeated stepped flights are looked up.
+
+    Stepped flights locate the impact between steps. Otherwise the
+    landing time snaps to whole steps, range jumps in a sawtooth as the
+    angle changes, and the search cannot get within `tol`.
+    """
+    template = projectile_class()
+    sim = Simulator(planet, solver=solver, cache=cache, forces=forces, locate_events=True)
+
+    def range_at(angle):
+        return sim.run(Launch.like(template, angle))["range_m"]
+
+    if method == "golden":
+        best_angle = golden_section_max(range_at, 0.0, 90.0, tol)
+        return best_angle, range_at(best_angle)
+    if method != "grid":
+        raise ValueError(f"unknown method {method!r}, expected 'golden' or 'grid'")
+
     best_angle = 0
     best_range = 0
-
     for angle in range(10, 85, 5):
-        proj = projectile_class.__new__(projectile_class)
-        Projectile.__init__(proj, launch_speed=projectile_class().launch_speed,
-                            launch_angle_deg=angle)
-        sim = Simulator(planet)
-        trajectory = sim.simulate(proj)
-        range_x = trajectory[-1][1].x
+        range_x = range_at(angle)
         if range_x > best_range:
             best_range = range_x
             best_angle = angle
@@ -277,8 +641,7 @@ def demo_extensions():
     print(f"\n  {jupiter.name} (g = {jupiter.g} m/s²)")
     print(f"  {'—' * 56}")
     for proj in projectiles:
-        trajectory = sim.simulate(proj)
-        result = Simulator.summarize(proj, trajectory)
+        result = sim.simulate_summary(proj)
         print(
             f"    {result['name']:12s} | "
             f"Height: {result['max_height_m']:8.1f} m | "
@@ -293,7 +656,935 @@ def demo_extensions():
     for proj in projectiles:
         for planet in planets:
             angle, rng = find_optimal_angle(type(proj), planet)
-            print(f"    {proj.name:12s} on {planet.name:8s} → {angle}° (range: {rng:.1f} m)")
+            print(f"    {proj.name:12s} on {planet.name:8s} → {angle:.1f}° (range: {rng:.1f} m)")
+
+    print(f"\n{'=' * 62}")
+
+
+# ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
+# PERFORMANCE EXTENSIONS
+# ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
+
+# ── PERF 1: Batch simulator ───────────────────────────────
+
+class Launch(Projectile):
+    """A projectile with arbitrary launch parameters, e.g. for sweeps."""
+
+    def __init__(self, name: str, launch_speed: float, launch_angle_deg: float, **body):
+        super().__init__(launch_speed, launch_angle_deg, **body)
+        self._name = name
+
+    @classmethod
+    def like(cls, projectile: Projectile, launch_angle_deg: float) -> "Launch":
+        """The same projectile launched at a different angle."""
+        return cls(projectile.name, projectile.launch_speed, launch_angle_deg,
+                   mass_kg=projectile.mass_kg, diameter_m=projectile.diameter_m,
+                   drag_coefficient=projectile.drag_coefficient)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+class BatchSimulator:
+    """Simulate N projectiles x M gravity models in one go.
+
+    Uses exactly the same Euler steps and stopping rule as `Simulator`,
+    but holds the state of every (projectile, planet) pair in NumPy
+    arrays. Pairs that have landed are dropped from the arrays, so each
+    step only touches projectiles still in flight. `forces` act on every
+    pair and are evaluated once per step for the whole batch.
+
+    With `locate_events`, each flight ends at the ground crossing inside
+    its last step, as `Simulator(locate_events=True)` does, instead of one
+    step below ground.
+    """
+
+    def __init__(self, gravity_models: list, dt: float = 0.01, forces: list = (),
+                 locate_events: bool = False):
+        self._gravity_models = list(gravity_models)
+        self._dt = dt
+        self._forces = tuple(forces)
+        self._locate_events = locate_events
+
+    def run(self, projectiles: list) -> list:
+        """Return `summaries[i][j]` for projectile i under gravity model j.
+
+        Each summary is the same dict `Simulator.summarize` produces.
+        """
+        dt = self._dt
+        n, m = len(projectiles), len(self._gravity_models)
+        accelerations = [model.acceleration() for model in self._gravity_models]
+
+        # Flattened pair index k = i * m + j
+        vx = np.repeat([p.initial_velocity.x for p in projectiles], m).astype(float)
+        vy = np.repeat([p.initial_velocity.y for p in projectiles], m).astype(float)
+        ax = np.tile([a.x for a in accelerations], n).astype(float)
+        ay = np.tile([a.y for a in accelerations], n).astype(float)
+        x = np.zeros(n * m)
+        y = np.zeros(n * m)
+        max_y = np.zeros(n * m)
+        pair = np.arange(n * m)
+        forces = self._forces
+        if forces:
+            body = Body(*(np.repeat(column, m) for column in zip(*map(Body.of, projectiles))))
+
+        range_m = np.zeros(n * m)
+        max_height_m = np.zeros(n * m)
+        flight_time_s = np.zeros(n * m)
+
+        t = 0.0
+        while pair.size:
+            step_ax, step_ay = ax, ay
+            if forces:
+                step_ax, step_ay = ax.copy(), ay.copy()
+                for force in forces:
+                    fx, fy = force.acceleration(x, y, vx, vy, body)
+                    step_ax += fx
+                    step_ay += fy
+            if self._locate_events:
+                start = x.copy(), y.copy(), vx.copy(), vy.copy()
+            vx += step_ax * dt
+            vy += step_ay * dt
+            x += vx * dt
+            y += vy * dt
+            t += dt
+            np.maximum(max_y, y, out=max_y)
+
+            landed = y < 0
+            if t > MAX_FLIGHT_TIME_S:
+                landed[:] = True
+            if landed.any():
+                done = pair[landed]
+                range_m[done] = x[landed]
+                max_height_m[done] = max_y[landed]
+                flight_time_s[done] = t
+                if self._locate_events:
+                    # Within a semi-implicit Euler step y(s) = y0 + (vy0 + ay s) s,
+                    # so the impact is the root of a quadratic in s
+                    x0, y0, vx0, vy0 = (column[landed] for column in start)
+                    land_ax, land_ay = step_ax[landed], step_ay[landed]
+                    root = np.sqrt(np.maximum(vy0 ** 2 - 4 * land_ay * y0, 0.0))
+                    s = np.divide(2 * y0, root - vy0, out=np.zeros_like(y0), where=root > vy0)
+                    s = np.where(y[landed] < 0, s, dt)
+                    range_m[done] = x0 + (vx0 + land_ax * s) * s
+                    flight_time_s[done] = t - dt + s
+                flying = ~landed
+                vx, vy, ax, ay = vx[flying], vy[flying], ax[flying], ay[flying]
+                x, y, max_y, pair = x[flying], y[flying], max_y[flying], pair[flying]
+                if forces:
+                    body = Body(*(column[flying] for column in body))
+
+        return [
+            [
+                {
+                    "name": proj.name,
+                    "max_height_m": float(max_height_m[i * m + j]),
+                    "range_m": float(range_m[i * m + j]),
+                    "flight_time_s": float(flight_time_s[i * m + j]),
+                }
+                for j in range(m)
+            ]
+            for i, proj in enumerate(projectiles)
+        ]
+
+
+# ── PERF 3: Pluggable integrators ─────────────────────────
+
+class Integrator(ABC):
+    """Strategy for advancing (position, velocity) by one time step.
+
+    `accel(pos, vel)` returns the acceleration at a state. `adaptive`
+    methods pick their own step sizes in `advance`.
+    """
+
+    adaptive = False
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @abstractmethod
+    def step(self, pos: Vector2D, vel: Vector2D, dt: float, accel) -> tuple:
+        """Advance exactly `dt` seconds and return (pos, vel)."""
+        pass
+
+    def advance(self, pos: Vector2D, vel: Vector2D, dt: float, accel) -> tuple:
+        """Take one step, choosing its size if the method is adaptive.
+
+        Returns (pos, vel, dt_used, dt_next). Fixed-step methods always use
+        `dt`.
+        """
+        pos, vel = self.step(pos, vel, dt, accel)
+        return pos, vel, dt, dt
+
+
+class ExplicitEuler(Integrator):
+    @property
+    def name(self) -> str:
+        return "Explicit Euler"
+
+    def step(self, pos, vel, dt, accel):
+        return pos.add(vel.scale(dt)), vel.add(accel(pos, vel).scale(dt))
+
+
+class SemiImplicitEuler(Integrator):
+    @property
+    def name(self) -> str:
+        return "Semi-implicit Euler"
+
+    def step(self, pos, vel, dt, accel):
+        vel_next = vel.add(accel(pos, vel).scale(dt))
+        return pos.add(vel_next.scale(dt)), vel_next
+
+
+class RungeKutta4(Integrator):
+    @property
+    def name(self) -> str:
+        return "RK4"
+
+    def step(self, pos, vel, dt, accel):
+        k1p, k1v = vel, accel(pos, vel)
+        p2, v2 = pos.add(k1p.scale(dt / 2)), vel.add(k1v.scale(dt / 2))
+        k2p, k2v = v2, accel(p2, v2)
+        p3, v3 = pos.add(k2p.scale(dt / 2)), vel.add(k2v.scale(dt / 2))
+        k3p, k3v = v3, accel(p3, v3)
+        p4, v4 = pos.add(k3p.scale(dt)), vel.add(k3v.scale(dt))
+        k4p, k4v = v4, accel(p4, v4)
+        return (
+            pos.add(k1p.add(k2p.scale(2)).add(k3p.scale(2)).add(k4p).scale(dt / 6)),
+            vel.add(k1v.add(k2v.scale(2)).add(k3v.scale(2)).add(k4v).scale(dt / 6)),
+        )
+
+
+class AdaptiveRK45(Integrator):
+    """Dormand–Prince 5(4): grows or shrinks the step to meet a tolerance."""
+
+    adaptive = True
+
+    _A = (
+        (),
+        (1 / 5,),
+        (3 / 40, 9 / 40),
+        (44 / 45, -56 / 15, 32 / 9),
+        (19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729),
+        (9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656),
+        (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84),
+    )
+    _B5 = (35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84, 0)
+    _B4 = (5179 / 57600, 0, 7571 / 16695, 393 / 640, -92097 / 339200, 187 / 2100, 1 / 40)
+
+    def __init__(self, rtol: float = 1e-6, atol: float = 1e-6, max_dt: float = math.inf):
+        self._rtol = rtol
+        self._atol = atol
+        self._max_dt = max_dt
+
+    @property
+    def name(self) -> str:
+        return "Adaptive RK45"
+
+    def _stages(self, pos, vel, dt, accel) -> list:
+        stages = []
+        for row in self._A:
+            p, v = pos, vel
+            for a, (kp, kv) in zip(row, stages):
+                p, v = p.add(kp.scale(a * dt)), v.add(kv.scale(a * dt))
+            stages.append((v, accel(p, v)))
+        return stages
+
+    @staticmethod
+    def _combine(pos, vel, dt, weights, stages) -> tuple:
+        for b, (kp, kv) in zip(weights, stages):
+            pos, vel = pos.add(kp.scale(b * dt)), vel.add(kv.scale(b * dt))
+        return pos, vel
+
+    def step(self, pos, vel, dt, accel):
+        return self._combine(pos, vel, dt, self._B5, self._stages(pos, vel, dt, accel))
+
+    def advance(self, pos, vel, dt, accel):
+        while True:
+            stages = self._stages(pos, vel, dt, accel)
+            pos5, vel5 = self._combine(pos, vel, dt, self._B5, stages)
+            pos4, vel4 = self._combine(pos, vel, dt, self._B4, stages)
+            # RMS of the per-component error relative to the tolerance
+            pairs = [(pos.x, pos5.x, pos4.x), (pos.y, pos5.y, pos4.y),
+                     (vel.x, vel5.x, vel4.x), (vel.y, vel5.y, vel4.y)]
+            error = math.sqrt(sum(
+                ((hi - lo) / (self._atol + self._rtol * max(abs(y0), abs(hi)))) ** 2
+                for y0, hi, lo in pairs
+            ) / 4)
+            factor = 5.0 if error == 0 else min(5.0, max(0.2, 0.9 * error ** -0.2))
+            if error <= 1:
+                return pos5, vel5, dt, min(dt * factor, self._max_dt)
+            dt *= factor
+
+
+def find_root(f, hi: float, tol: float = 1e-12) -> float:
+    """Find s in [0, hi] with f(s) = 0, given f(0) and f(hi) differ in sign.
+
+    Regula falsi with the Illinois tweak, which converges quickly for the
+    smooth, nearly polynomial functions a single step produces.
+    """
+    lo, f_lo, f_hi = 0.0, f(0.0), f(hi)
+    if f_lo == 0:
+        return lo
+    side = 0
+    for _ in range(100):
+        s = hi - f_hi * (hi - lo) / (f_hi - f_lo)
+        f_s = f(s)
+        if f_s == 0 or hi - lo < tol:
+            return s
+        if (f_s > 0) == (f_hi > 0):
+            hi, f_hi = s, f_s
+            if side == -1:
+                f_lo /= 2
+            side = -1
+        else:
+            lo, f_lo = s, f_s
+            if side == 1:
+                f_hi /= 2
+            side = 1
+    return s
+
+
+# ── PERF 4: Compact trajectories ──────────────────────────
+
+def list_trajectory_bytes(samples: list) -> int:
+    """Approximate memory of a list of (t, Vector2D) tuples."""
+    per_sample = (
+        sys.getsizeof((0.0, None))              # the tuple
+        + sys.getsizeof(0.0)                    # t
+        + sys.getsizeof(Vector2D(0.0, 0.0))     # the vector
+        + 2 * sys.getsizeof(0.0)                # its x and y
+    )
+    return sys.getsizeof(samples) + len(samples) * per_sample
+
+
+# ── PERF 5: Optimal angle search ──────────────────────────
+
+GOLDEN_RATIO = (math.sqrt(5) - 1) / 2
+
+
+def golden_section_max(f, lo: float, hi: float, tol: float) -> float:
+    """Maximize a unimodal `f` on [lo, hi] to within `tol`.
+
+    Each iteration shrinks the bracket by the golden ratio and reuses one
+    of the two previous evaluations, so it costs one call of `f`.
+    """
+    a = hi - GOLDEN_RATIO * (hi - lo)
+    b = lo + GOLDEN_RATIO * (hi - lo)
+    f_a, f_b = f(a), f(b)
+    while hi - lo > tol:
+        if f_a < f_b:
+            lo, a, f_a = a, b, f_b
+            b = lo + GOLDEN_RATIO * (hi - lo)
+            f_b = f(b)
+        else:
+            hi, b, f_b = b, a, f_a
+            a = hi - GOLDEN_RATIO * (hi - lo)
+            f_a = f(a)
+    return (lo + hi) / 2
+
+
+def optimal_angle_matrix(projectile_classes: list, planets: list,
+                         step: float = 0.5, dt: float = 0.01) -> list:
+    """Best (angle, range) for every projectile x planet from one batch run.
+
+    Sweeps 0-90° every `step` degrees for all projectiles and planets in a
+    single `BatchSimulator` run (Euler, like `Simulator`) and returns
+    `results[i][j]` for projectile class i on planet j. Impacts are located
+    within the last step, so ranges vary smoothly with the angle instead of
+    in whole-step jumps.
+    """
+    angles = np.arange(0.0, 90.0 + step / 2, step)
+    templates = [cls() for cls in projectile_classes]
+    launches = [
+        Launch(proj.name, proj.launch_speed, float(angle))
+        for proj in templates
+        for angle in angles
+    ]
+    summaries = BatchSimulator(planets, dt, locate_events=True).run(launches)
+
+    results = []
+    for i in range(len(templates)):
+        rows = summaries[i * len(angles):(i + 1) * len(angles)]
+        best = []
+        for j in range(len(planets)):
+            ranges = [row[j]["range_m"] for row in rows]
+            k = int(np.argmax(ranges))
+            best.append((float(angles[k]), ranges[k]))
+        results.append(best)
+    return results
+
+
+# ── PERF 6: Parallel sweeps ───────────────────────────────
+
+def _summary_job(job: tuple) -> dict:
+    projectile, planet, dt, solver = job
+    return Simulator(planet, dt, solver).run(projectile)
+
+
+def _optimal_angle_job(job: tuple) -> tuple:
+    projectile_class, planet, method, solver = job
+    return find_optimal_angle(projectile_class, planet, method=method, solver=solver)
+
+
+class SweepRunner:
+    """Run independent simulation jobs on a pool of worker processes.
+
+    Jobs are submitted in chunks to keep pickling overhead low, and the
+    results always come back in job order, however the work was scheduled.
+    Projectiles and gravity models are plain classes, so they pickle as-is.
+    """
+
+    def __init__(self, workers: int = None, chunksize: int = None):
+        self._workers = workers or os.cpu_count() or 1
+        self._chunksize = chunksize
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    def map(self, fn, jobs: list) -> list:
+        """Apply a picklable, module-level `fn` to every job, in order."""
+        jobs = list(jobs)
+        # About four chunks per worker balances overhead against stragglers
+        chunksize = self._chunksize or max(1, -(-len(jobs) // (4 * self._workers)))
+        with ProcessPoolExecutor(self._workers) as pool:
+            return list(pool.map(fn, jobs, chunksize=chunksize))
+
+    def summaries(self, projectiles: list, planets: list,
+                  dt: float = 0.01, solver: str = "euler") -> list:
+        """`results[i][j]` is the summary of projectile i on planet j."""
+        jobs = [(proj, planet, dt, solver) for proj in projectiles for planet in planets]
+        flat = self.map(_summary_job, jobs)
+        return [flat[i * len(planets):(i + 1) * len(planets)] for i in range(len(projectiles))]
+
+    def optimal_angles(self, projectile_classes: list, planets: list,
+                       method: str = "golden", solver: str = "auto") -> list:
+        """`results[i][j]` is (angle, range) for projectile class i on planet j."""
+        jobs = [(cls, planet, method, solver) for cls in projectile_classes for planet in planets]
+        flat = self.map(_optimal_angle_job, jobs)
+        return [flat[i * len(planets):(i + 1) * len(planets)] for i in range(len(projectile_classes))]
+
+
+# ── PERF 7: Simulation cache ──────────────────────────────
+
+class SimulationCache:
+    """Bounded LRU cache of flight summaries, keyed on `Simulator.cache_key`.
+
+    Keys are physical parameters, not objects, so a new `Baseball()` on a
+    new `Earth()` hits the entry left by an earlier one. Once `maxsize`
+    entries are held, the least recently used one is evicted.
+
+    With a `path`, every summary is also written through to a `shelve`
+    file there, and a memory miss falls back to it. A later run pointed at
+    the same file skips every integration already done. Only summaries are
+    cached: trajectories are far larger, and `Simulator.stream` already
+    avoids holding them.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: str = None):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._path = path
+        self._shelf = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _disk(self):
+        if self._shelf is None:
+            self._shelf = shelve.open(self._path)
+        return self._shelf
+
+    def _remember(self, key: tuple, value: tuple):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def get(self, key: tuple):
+        """Return the cached (max_height, range, flight_time), or None."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+        if self._path is not None:
+            # repr() of floats round-trips exactly, so it is a safe shelf key
+            value = self._disk().get(repr(key))
+            if value is not None:
+                self._remember(key, value)
+                self.disk_hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def put(self, key: tuple, value: tuple):
+        self._remember(key, value)
+        if self._path is not None:
+            self._disk()[repr(key)] = value
+
+    def clear(self):
+        """Drop the in-memory entries and statistics (the disk tier stays)."""
+        self._entries.clear()
+        self.hits = self.disk_hits = self.misses = 0
+
+    def close(self):
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    @property
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+        }
+
+
+# ── PERF 8: Force models ──────────────────────────────────
+
+class Body(NamedTuple):
+    """What forces need to know about a projectile.
+
+    Fields are floats for one projectile or equal-length arrays for a
+    batch; forces are written so that both work.
+    """
+    mass_kg: float
+    cross_section_m2: float
+    drag_coefficient: float
+
+    @classmethod
+    def of(cls, projectile: Projectile) -> "Body":
+        if projectile.mass_kg is None or projectile.diameter_m is None:
+            raise ValueError(f"{projectile.name} needs a mass and a diameter to feel forces")
+        return cls(projectile.mass_kg, projectile.cross_section_m2, projectile.drag_coefficient)
+
+
+class Force(ABC):
+    """A force acting on top of gravity, evaluated for many states at once.
+
+    `acceleration` gets positions and velocities as NumPy arrays (or
+    scalars) plus a matching `Body`, and returns (ax, ay) the same shape.
+    Forces compose by listing them: their accelerations are summed.
+    """
+
+    @abstractmethod
+    def acceleration(self, x, y, vx, vy, body: Body) -> tuple:
+        pass
+
+
+class ConstantDensity:
+    """Air density that does not change with altitude, in kg/m³."""
+
+    def __init__(self, rho: float = 1.225):
+        self._rho = rho
+
+    def __call__(self, y):
+        return self._rho
+
+    def __repr__(self) -> str:
+        return f"ConstantDensity({self._rho!r})"
+
+
+class ExponentialAtmosphere:
+    """Isothermal atmosphere: ρ(y) = ρ0 exp(-y / H)."""
+
+    def __init__(self, rho0: float = 1.225, scale_height_m: float = 8500.0):
+        self._rho0 = rho0
+        self._scale_height = scale_height_m
+
+    def __call__(self, y):
+        return self._rho0 * np.exp(-y / self._scale_height)
+
+    def __repr__(self) -> str:
+        return f"ExponentialAtmosphere({self._rho0!r}, {self._scale_height!r})"
+
+
+class UniformWind:
+    """Horizontal wind of the same speed everywhere (positive is a tailwind)."""
+
+    def __init__(self, speed: float):
+        self._speed = speed
+
+    def __call__(self, x, y) -> tuple:
+        return self._speed, 0.0
+
+    def __repr__(self) -> str:
+        return f"UniformWind({self._speed!r})"
+
+
+class PowerLawWind:
+    """Wind shear near the ground: u(y) = u_ref (y / y_ref) ** alpha."""
+
+    def __init__(self, reference_speed: float, reference_height_m: float = 10.0,
+                 exponent: float = 1 / 7):
+        self._speed = reference_speed
+        self._height = reference_height_m
+        self._exponent = exponent
+
+    def __call__(self, x, y) -> tuple:
+        return self._speed * (np.maximum(y, 0.0) / self._height) ** self._exponent, 0.0
+
+    def __repr__(self) -> str:
+        return f"PowerLawWind({self._speed!r}, {self._height!r}, {self._exponent!r})"
+
+
+class QuadraticDrag(Force):
+    """Air resistance, a = -½ ρ Cd A |v - w| (v - w) / m.
+
+    `density` maps altitude to ρ and `wind` maps position to the air
+    velocity w; both take arrays, like the force itself.
+    """
+
+    def __init__(self, density=None, wind=None):
+        self._density = ConstantDensity() if density is None else density
+        self._wind = wind
+
+    def acceleration(self, x, y, vx, vy, body):
+        rel_x, rel_y = vx, vy
+        if self._wind is not None:
+            wx, wy = self._wind(x, y)
+            rel_x, rel_y = vx - wx, vy - wy
+        k = (0.5 * body.drag_coefficient * body.cross_section_m2 / body.mass_kg
+             * self._density(y) * np.hypot(rel_x, rel_y))
+        return -k * rel_x, -k * rel_y
+
+    def __repr__(self) -> str:
+        return f"QuadraticDrag({self._density!r}, {self._wind!r})"
+
+
+# ── PERF 9: Instrumentation ───────────────────────────────
+
+class Instrumentation:
+    """Opt-in measurements of `Simulator.simulate` and `simulate_summary`.
+
+    Pass one to `Simulator(instrumentation=...)` (several simulators can
+    share it). Each simulation adds a record with its step count and wall
+    time. Two heavier measurements are opt-in, and their records' timings
+    are not comparable with plain ones:
+
+      count_allocations: every `Vector2D` built during the run is counted
+                         (the per-step allocations of the integrator), by
+                         wrapping `Vector2D.__init__` only inside `measure`
+      track_memory:      `tracemalloc` records the peak bytes held at once
+                         during the run
+
+    A simulation answered from the cache records zero steps.
+
+    The `Vector2D.__init__` wrapper is class-wide, so vectors built by
+    other threads during a counted run are counted too. Count allocations
+    only while one thread is simulating.
+    """
+
+    def __init__(self, count_allocations: bool = False, track_memory: bool = False):
+        self._count_allocations = count_allocations
+        self._track_memory = track_memory
+        self._steps = 0
+        self.records = []
+
+    def counted(self, samples):
+        """Pass `samples` through, counting the integration steps."""
+        steps = -1  # the first sample is the launch, not a step
+        for steps, sample in enumerate(samples):
+            yield sample
+        self._steps += steps
+
+    def measure(self, method, simulator, projectile, *args, **kwargs):
+        """Call `method` and record how long it took and how many steps."""
+        self._steps = 0
+        tracing = self._track_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if self._track_memory:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        vectors = 0
+        if self._count_allocations:
+            vector_init = Vector2D.__init__
+
+            def counting_init(vector, x, y):
+                nonlocal vectors
+                vectors += 1
+                vector_init(vector, x, y)
+
+            Vector2D.__init__ = counting_init
+
+        start = time.perf_counter()
+        try:
+            result = method(simulator, projectile, *args, **kwargs)
+        finally:
+            wall = time.perf_counter() - start
+            if self._count_allocations:
+                Vector2D.__init__ = vector_init
+            if self._track_memory:
+                peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+                if tracing:
+                    tracemalloc.stop()
+
+        steps = self._steps
+        record = {
+            "method": method.__name__,
+            "projectile": projectile.name,
+            **simulator.describe(),
+            "steps": steps,
+            "wall_s": wall,
+            "us_per_step": wall * 1e6 / steps if steps else 0.0,
+        }
+        if self._count_allocations:
+            record["vectors"] = vectors
+            record["vectors_per_step"] = vectors / steps if steps else 0.0
+        if self._track_memory:
+            record["peak_bytes"] = peak_bytes
+        self.records.append(record)
+        return result
+
+    def summary(self) -> dict:
+        """Totals per method: simulations, steps, wall time, µs per step."""
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(record["method"], {
+                "simulations": 0, "steps": 0, "wall_s": 0.0,
+            })
+            total["simulations"] += 1
+            total["steps"] += record["steps"]
+            total["wall_s"] += record["wall_s"]
+            if "vectors" in record:
+                total["vectors"] = total.get("vectors", 0) + record["vectors"]
+            if "peak_bytes" in record:
+                total["peak_bytes"] = max(total.get("peak_bytes", 0), record["peak_bytes"])
+        for total in totals.values():
+            total["us_per_step"] = total["wall_s"] * 1e6 / total["steps"] if total["steps"] else 0.0
+            if "vectors" in total:
+                total["vectors_per_step"] = total["vectors"] / total["steps"] if total["steps"] else 0.0
+        return totals
+
+    def export(self, path: str):
+        """Write the records as CSV if `path` ends in .csv, otherwise as JSON."""
+        if path.endswith(".csv"):
+            fields = list(dict.fromkeys(key for record in self.records for key in record))
+            with open(path, "w", newline="") as f:
+                writer = csv.DictWriter(f, fieldnames=fields)
+                writer.writeheader()
+                writer.writerows(self.records)
+        else:
+            with open(path, "w") as f:
+                json.dump({"summary": self.summary(), "records": self.records}, f, indent=2)
+
+    def clear(self):
+        self.records.clear()
+
+
+def demo_performance():
+    print("\n" + "=" * 62)
+    print("         PERFORMANCE EXTENSIONS")
+    print("=" * 62)
+
+    planets = [Earth(), Moon(), Mars(), Jupiter()]
+
+    # PERF 1: Batch sweep vs one Simulator run at a time
+    launches = [
+        Launch(f"{speed} m/s @ {angle}°", speed, angle)
+        for speed in range(20, 101, 20)
+        for angle in range(10, 85, 10)
+    ]
+    start = time.perf_counter()
+    serial = [
+        [Simulator.summarize(proj, Simulator(planet).simulate(proj)) for planet in planets]
+        for proj in launches
+    ]
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = BatchSimulator(planets).run(launches)
+    batch_s = time.perf_counter() - start
+
+    worst = max(
+        abs(a[key] - b[key])
+        for row_a, row_b in zip(serial, batch)
+        for a, b in zip(row_a, row_b)
+        for key in ("max_height_m", "range_m", "flight_time_s")
+    )
+    print(f"\n  Batch sweep ({len(launches)} launches × {len(planets)} planets):")
+    print(f"  {'—' * 56}")
+    print(f"    Simulator, one at a time: {serial_s * 1000:8.1f} ms")
+    print(f"    BatchSimulator:           {batch_s * 1000:8.1f} ms "
+          f"({serial_s / batch_s:.0f}× faster, max difference {worst:.1e})")
+
+    # PERF 6: The same sweep on a process pool
+    runner = SweepRunner()
+    start = time.perf_counter()
+    parallel = runner.summaries(launches, planets)
+    parallel_s = time.perf_counter() - start
+    label = f"SweepRunner ({runner.workers} workers):"
+    print(f"    {label:26s}{parallel_s * 1000:8.1f} ms "
+          f"({serial_s / parallel_s:.1f}× faster, identical: {parallel == serial})")
+
+    # PERF 2: How far the Euler demo numbers are from the exact answer
+    print(f"\n  Euler (dt = 0.01 s) error vs closed form:")
+    print(f"  {'—' * 56}")
+    for planet in planets:
+        euler = Simulator(planet, solver="euler")
+        exact = Simulator(planet, solver="analytic")
+        for proj in [Baseball(), Cannonball(), GolfBall()]:
+            e, a = euler.run(proj), exact.run(proj)
+            print(
+                f"    {proj.name:12s} on {planet.name:8s} | "
+                f"Height: {e['max_height_m'] - a['max_height_m']:+6.2f} m | "
+                f"Range: {e['range_m'] - a['range_m']:+6.2f} m | "
+                f"Time: {e['flight_time_s'] - a['flight_time_s']:+6.3f} s"
+            )
+
+    # PERF 3: Integrators and event location, Cannonball on the Moon
+    proj, moon = Cannonball(), Moon()
+    exact = Simulator(moon, solver="analytic").run(proj)
+    print(f"\n  Integrators ({proj.name} on {moon.name}, error vs closed form):")
+    print(f"  {'—' * 56}")
+    setups = [
+        ("Semi-implicit Euler", Simulator(moon)),
+        ("  + event location", Simulator(moon, locate_events=True)),
+        ("RK4, dt = 1 s", Simulator(moon, dt=1.0, integrator=RungeKutta4())),
+        ("Adaptive RK45", Simulator(moon, dt=1.0, integrator=AdaptiveRK45())),
+    ]
+    for label, sim in setups:
+        trajectory = sim.simulate(proj)
+        result = Simulator.summarize(proj, trajectory)
+        print(
+            f"    {label:20s} | {len(trajectory):5d} points | "
+            f"Height: {abs(result['max_height_m'] - exact['max_height_m']):7.1e} m | "
+            f"Range: {abs(result['range_m'] - exact['range_m']):7.1e} m"
+        )
+
+    # PERF 5: Optimal angle search, 3 projectiles × 4 planets
+    classes = [Baseball, Cannonball, GolfBall]
+    searches = [
+        ("5° grid, Euler", lambda: [[find_optimal_angle(c, p, method="grid", solver="euler")
+                                    for p in planets] for c in classes]),
+        ("Golden 0.01°, Euler", lambda: [[find_optimal_angle(c, p, solver="euler")
+                                         for p in planets] for c in classes]),
+        ("Golden 0.01°, exact", lambda: [[find_optimal_angle(c, p)
+                                         for p in planets] for c in classes]),
+        ("Batch sweep 0.5°", lambda: optimal_angle_matrix(classes, planets)),
+    ]
+    print(f"\n  Optimal angle search ({len(classes)} projectiles × {len(planets)} planets):")
+    print(f"  {'—' * 56}")
+    for label, search in searches:
+        start = time.perf_counter()
+        results = search()
+        elapsed = time.perf_counter() - start
+        angles = [angle for row in results for angle, _ in row]
+        print(f"    {label:20s} | {elapsed * 1000:8.1f} ms | "
+              f"angles {min(angles):.2f}°-{max(angles):.2f}°")
+
+    # PERF 7: The grid search again, through a cache, then from a fresh
+    # process's point of view with only the disk tier warm
+    cache_summary = lambda cache: (
+        "{hits} hits, {disk_hits} from disk, {misses} misses".format(**cache.stats))
+    grid = lambda cache: [[find_optimal_angle(c, p, method="grid", solver="euler", cache=cache)
+                           for p in planets] for c in classes]
+    print(f"\n  Simulation cache (5° grid, Euler):")
+    print(f"  {'—' * 56}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "summaries")
+        with SimulationCache(path=path) as cache:
+            for label in ("Cold cache", "Warm cache"):
+                start = time.perf_counter()
+                grid(cache)
+                elapsed = time.perf_counter() - start
+                print(f"    {label:20s} | {elapsed * 1000:8.1f} ms | {cache_summary(cache)}")
+        with SimulationCache(path=path) as cache:
+            start = time.perf_counter()
+            grid(cache)
+            elapsed = time.perf_counter() - start
+            print(f"    {'Disk tier only':20s} | {elapsed * 1000:8.1f} ms | {cache_summary(cache)}")
+
+    # PERF 8: Drag, wind and a thinning atmosphere on Earth
+    earth = planets[0]
+    air = QuadraticDrag(ExponentialAtmosphere())
+    models = [
+        ("Vacuum", []),
+        ("Drag", [air]),
+        ("Drag, 10 m/s headwind", [QuadraticDrag(ExponentialAtmosphere(), UniformWind(-10.0))]),
+        ("Drag, sheared tailwind", [QuadraticDrag(ExponentialAtmosphere(), PowerLawWind(10.0))]),
+    ]
+    print(f"\n  Force models ({earth.name}, range in m):")
+    print(f"  {'—' * 56}")
+    print(f"    {'':22s} | {'Baseball':>9s} | {'Cannonball':>10s} | {'Golf Ball':>9s}")
+    for label, forces in models:
+        sim = Simulator(earth, forces=forces)
+        ranges = [sim.run(proj)["range_m"] for proj in [Baseball(), Cannonball(), GolfBall()]]
+        print(f"    {label:22s} | {ranges[0]:9.1f} | {ranges[1]:10.1f} | {ranges[2]:9.1f}")
+    for ball in [Baseball(), Cannonball(), GolfBall()]:
+        angle, range_x = find_optimal_angle(type(ball), earth, forces=[air])
+        print(f"    {ball.name:12s} best angle with drag → {angle:.1f}° (range: {range_x:.1f} m)")
+
+    drag_launches = [Launch.like(Cannonball(), float(angle)) for angle in range(5, 90, 5)]
+    start = time.perf_counter()
+    serial = [Simulator(earth, forces=[air]).run(proj)["range_m"] for proj in drag_launches]
+    serial_s = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = [row[0]["range_m"] for row in BatchSimulator([earth], forces=[air]).run(drag_launches)]
+    batch_s = time.perf_counter() - start
+    worst = max(abs(a - b) for a, b in zip(serial, batch))
+    print(f"    {len(drag_launches)} drag launches: Simulator {serial_s * 1000:.1f} ms, "
+          f"BatchSimulator {batch_s * 1000:.1f} ms (max difference {worst:.1e})")
+
+    # PERF 9: What one Euler step costs, and what measuring it costs
+    print(f"\n  Instrumentation (5° grid, Euler, {len(classes)} projectiles × {len(planets)} planets):")
+    print(f"  {'—' * 56}")
+    for label, instrumentation in [("Off", None), ("Steps + time", Instrumentation()),
+                                   ("+ allocations", Instrumentation(count_allocations=True)),
+                                   ("+ tracemalloc", Instrumentation(track_memory=True))]:
+        start = time.perf_counter()
+        for cls in classes:
+            for planet in planets:
+                sim = Simulator(planet, solver="euler", instrumentation=instrumentation)
+                for angle in range(10, 85, 5):
+                    sim.run(Launch.like(cls(), angle))
+        elapsed = time.perf_counter() - start
+        line = f"    {label:20s} | {elapsed * 1000:8.1f} ms"
+        if instrumentation is not None:
+            total = instrumentation.summary()["simulate_summary"]
+            line += f" | {total['steps']:,} steps, {total['us_per_step']:.2f} µs/step"
+            if "vectors_per_step" in total:
+                line += f", {total['vectors_per_step']:.1f} Vector2D/step"
+            if "peak_bytes" in total:
+                line += f", peak {total['peak_bytes']} B"
+        print(line)
+    tracer = Instrumentation(count_allocations=True, track_memory=True)
+    trajectory = Simulator(moon, instrumentation=tracer).simulate(proj)
+    record = tracer.records[-1]
+    print(f"    simulate() on {moon.name}: {record['steps']:,} steps, "
+          f"{record['vectors_per_step']:.1f} Vector2D/step, "
+          f"peak {record['peak_bytes'] / 1024:.1f} KiB")
+
+    # PERF 4: Memory held by one trajectory
+    trajectory = Simulator(moon).simulate(proj)
+    as_list = list(trajectory)
+    print(f"\n  Trajectory memory ({proj.name} on {moon.name}, {len(trajectory)} points):")
+    print(f"  {'—' * 56}")
+    print(f"    List of (t, Vector2D) tuples: {list_trajectory_bytes(as_list) / 1024:8.1f} KiB")
+    print(f"    Trajectory (float arrays):    {trajectory.nbytes / 1024:8.1f} KiB")
 
     print(f"\n{'=' * 62}")
 
@@ -301,3 +1592,5 @@ def demo_extensions():
 if __name__ == "__main__":
     demo()
     demo_extensions()
+    if "--perf" in sys.argv[1:]:
+        demo_performance()
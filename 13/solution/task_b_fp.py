@@ -8,11 +8,23 @@ acceleration using pure functional programming.
 Physics: T = 2π √(L / g)  →  g = 4π² L / T²
 
 Run with: python task_b_fp.py
+          python task_b_fp.py --perf    (also the performance extensions)
 """
 
 from functools import reduce
 from collections import namedtuple
+from itertools import chain, islice, repeat
+from operator import attrgetter
+from types import MappingProxyType
+import csv
 import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
 
 
 # ── Data ───────────────────────────────────────────────────
@@ -68,28 +80,34 @@ def calculate_g(trial):
 # ── TODO 3 ─────────────────────────────────────────────────
 
 def trials_by_location(trials):
-    """Group trials by location using reduce. No mutation."""
-    return reduce(
-        lambda acc, t: {**acc, t.location: [*acc.get(t.location, []), t]},
-        trials,
-        {},
-    )
+    """Group trials by location. No visible mutation.
+
+    Returns a read-only mapping of location → tuple of trials (see
+    `group_by`).
+    """
+    return group_by("location")(trials)
 
 
 # ── TODO 4 ─────────────────────────────────────────────────
 
 def average_g(trials):
-    """Calculate the mean g value from a list of trials using reduce."""
-    if not trials:
-        return 0.0
-    total = reduce(lambda acc, t: acc + calculate_g(t), trials, 0.0)
-    return total / len(trials)
+    """Calculate the mean g value from trials using reduce.
+
+    Takes any iterable of trials (see `g_stats`); no trials gives 0.0.
+    """
+    return g_stats(trials).mean
 
 
 # ── TODO 5 ─────────────────────────────────────────────────
 
-def create_filter(predicate):
-    """Higher-order function: returns a function that filters trials."""
+def create_filter(predicate, lazy=False):
+    """Higher-order function: returns a function that filters trials.
+
+    With `lazy`, returns a `Stage` that `pipeline` can fuse instead of a
+    function that builds a list.
+    """
+    if lazy:
+        return lazy_filter(predicate)
     return lambda trials: list(filter(predicate, trials))
 
 
@@ -168,24 +186,19 @@ ALL_DATA = [*EXPERIMENT_DATA, *BASEMENT_DATA]
 # ── EXT 2: Standard deviation ─────────────────────────────
 
 def std_deviation_g(trials):
-    """Standard deviation of g values: σ = √(Σ(gᵢ - ḡ)² / n)."""
-    if not trials:
-        return 0.0
-    mean = average_g(trials)
-    sum_sq = reduce(
-        lambda acc, t: acc + (calculate_g(t) - mean) ** 2,
-        trials,
-        0.0,
-    )
-    return math.sqrt(sum_sq / len(trials))
+    """Standard deviation of g values: σ = √(Σ(gᵢ - ḡ)² / n).
+
+    One pass over any iterable of trials (see `g_stats`).
+    """
+    return std_deviation(g_stats(trials))
 
 
 # ── EXT 3: Most precise location ──────────────────────────
 
 def most_precise_location(trials):
     """Find location with lowest std deviation of g."""
-    grouped = trials_by_location(trials)
-    return min(grouped.keys(), key=lambda loc: std_deviation_g(grouped[loc]))
+    stats = g_stats_by(trials_by_location(trials))
+    return min(stats.keys(), key=lambda loc: std_deviation(stats[loc]))
 
 
 def demo_extensions():
@@ -193,19 +206,17 @@ def demo_extensions():
     print("      PHASE 2 EXTENSIONS")
     print("=" * 55)
 
-    # Precision ranking
-    grouped = trials_by_location(ALL_DATA)
+    # Precision ranking, from one pass over each location's trials
+    stats = g_stats_by(trials_by_location(ALL_DATA))
     print(f"\n  Precision Ranking (by std deviation of g):")
     print(f"  {'—' * 50}")
 
-    ranked = sorted(grouped.keys(), key=lambda loc: std_deviation_g(grouped[loc]))
+    ranked = sorted(stats.keys(), key=lambda loc: std_deviation(stats[loc]))
     for i, loc in enumerate(ranked, 1):
-        trials = grouped[loc]
-        avg = average_g(trials)
-        std = std_deviation_g(trials)
+        s = stats[loc]
         print(
-            f"    {i}. {loc:10s} | {len(trials):2d} trials | "
-            f"avg g = {avg:.4f} | σ = {std:.4f} m/s²"
+            f"    {i}. {loc:10s} | {s.count:2d} trials | "
+            f"avg g = {s.mean:.4f} | σ = {std_deviation(s):.4f} m/s²"
         )
 
     best = most_precise_location(ALL_DATA)
@@ -214,6 +225,589 @@ def demo_extensions():
     print(f"\n{'=' * 55}")
 
 
+# ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
+# PERFORMANCE EXTENSIONS
+# ▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒▒
+
+# ── PERF 1: Linear-time grouping ──────────────────────────
+
+def group_by(key):
+    """Higher-order function: returns a function that groups trials.
+
+    `key` is a Trial field name, a tuple of field names for a composite
+    key (grouped under tuples of values), or any function of a trial.
+
+    The returned function makes one pass, appending to lists it owns,
+    and then freezes them: callers get a read-only mapping of key → tuple
+    of trials, in first-seen order. Rebuilding the dict and list for every
+    trial, as a reduce would, copies O(n²) elements.
+    """
+    if isinstance(key, str):
+        key = attrgetter(key)
+    elif isinstance(key, tuple):
+        fields = attrgetter(*key)
+        # attrgetter of a single name returns a bare value, not a 1-tuple
+        key = (lambda t: (fields(t),)) if len(key) == 1 else fields
+
+    def grouped(trials):
+        groups = {}
+        for trial in trials:
+            groups.setdefault(key(trial), []).append(trial)
+        return MappingProxyType({k: tuple(v) for k, v in groups.items()})
+
+    return grouped
+
+
+# ── PERF 2: Single-pass statistics ────────────────────────
+
+# `m2` is the sum of squared deviations from the mean, which stays
+# accurate where Σx² - n·x̄² would cancel
+Stats = namedtuple("Stats", ["count", "mean", "m2", "min", "max"])
+
+EMPTY_STATS = Stats(0, 0.0, 0.0, math.inf, -math.inf)
+
+# Values summarized at a time by `g_stats` (bounds memory on long streams)
+STATS_CHUNK = 4096
+
+
+def merge_stats(a, b):
+    """Combine the stats of two disjoint chunks (Chan et al.)."""
+    count = a.count + b.count
+    if count == 0:
+        return EMPTY_STATS
+    delta = b.mean - a.mean
+    return Stats(
+        count,
+        a.mean + delta * b.count / count,
+        a.m2 + b.m2 + delta * delta * a.count * b.count / count,
+        min(a.min, b.min),
+        max(a.max, b.max),
+    )
+
+
+def stats_of(values):
+    """Stats of a list of values, from four builtin passes over the list.
+
+    One each for the sum, the squared deviations, the min and the max.
+    """
+    if not values:
+        return EMPTY_STATS
+    mean = sum(values) / len(values)
+    return Stats(
+        len(values),
+        mean,
+        sum([(x - mean) ** 2 for x in values]),
+        min(values),
+        max(values),
+    )
+
+
+def variance(stats):
+    """Population variance, Σ(xᵢ - x̄)² / n (0.0 for no values)."""
+    return stats.m2 / stats.count if stats.count else 0.0
+
+
+def std_deviation(stats):
+    return math.sqrt(variance(stats))
+
+
+def value_stats(values, chunk_size=STATS_CHUNK):
+    """Count, mean, M2, min and max over any iterable of numbers.
+
+    One pass, so values can come from a generator. They are summarized
+    `chunk_size` at a time, which runs the inner loops in builtins instead
+    of one Python-level update per value; chunks combine with
+    `merge_stats`, like any other partition.
+    """
+    values = iter(values)
+    chunks = iter(lambda: list(islice(values, chunk_size)), [])
+    return reduce(merge_stats, map(stats_of, chunks), EMPTY_STATS)
+
+
+def g_stats(trials, chunk_size=STATS_CHUNK):
+    """`value_stats` of g over any iterable of trials."""
+    return value_stats(map(calculate_g, trials), chunk_size)
+
+
+def g_stats_by(grouped):
+    """`g_stats` for every group of a `group_by` mapping."""
+    return MappingProxyType({key: g_stats(trials) for key, trials in grouped.items()})
+
+
+# ── PERF 3: Columnar trial table ──────────────────────────
+
+# A column of repeated labels: small integer codes into a tuple of names
+Categorical = namedtuple("Categorical", ["codes", "categories"])
+
+# The Trial fields as read-only arrays, one per field
+TrialTable = namedtuple("TrialTable", Trial._fields)
+
+CATEGORICAL_FIELDS = ("location", "notes")
+
+
+def _frozen(array):
+    array.setflags(write=False)
+    return array
+
+
+def _sorted_categorical(codes, labels):
+    """Re-code `codes` into `labels` so the categories come out sorted."""
+    categories = tuple(sorted(labels))
+    rank = np.array([categories.index(v) for v in labels], dtype=np.int32)
+    return Categorical(_frozen(rank[codes] if len(codes) else codes.astype(np.int32)), categories)
+
+
+def _categorical(values):
+    """Encode labels as codes into their sorted distinct values."""
+    first_seen = {}
+    codes = np.fromiter((first_seen.setdefault(v, len(first_seen)) for v in values),
+                        dtype=np.int32, count=len(values))
+    return _sorted_categorical(codes, list(first_seen))
+
+
+def to_table(trials):
+    """Columnar copy of an iterable of trials.
+
+    `trial_id` becomes an int64 array and the measurements float64 ones,
+    so fractional swing counts survive; `location`/`notes` become
+    `Categorical` codes. No array can be written to, so a table is as
+    immutable as the trials it came from.
+    """
+    columns = tuple(zip(*trials)) or ((),) * len(Trial._fields)
+    trial_id, length_m, num_swings, total_time_s, location, notes = columns
+    return TrialTable(
+        _frozen(np.array(trial_id, dtype=np.int64)),
+        _frozen(np.array(length_m, dtype=np.float64)),
+        _frozen(np.array(num_swings, dtype=np.float64)),
+        _frozen(np.array(total_time_s, dtype=np.float64)),
+        _categorical(location),
+        _categorical(notes),
+    )
+
+
+def decode(column):
+    """A table column as a list of plain Python values."""
+    if isinstance(column, Categorical):
+        return [column.categories[code] for code in column.codes.tolist()]
+    return column.tolist()
+
+
+def from_table(table):
+    """The trials of a table, equal to the ones it was built from."""
+    return tuple(map(Trial, *map(decode, table)))
+
+
+def table_period(table):
+    """Vectorized `period` for every trial in the table."""
+    return table.total_time_s / table.num_swings
+
+
+def table_g(table):
+    """Vectorized `calculate_g` for every trial in the table."""
+    t = table_period(table)
+    return (4 * math.pi ** 2 * table.length_m) / (t ** 2)
+
+
+def where(table, mask):
+    """The rows of `table` where the boolean `mask` is True."""
+    return TrialTable(*(
+        Categorical(_frozen(column.codes[mask]), column.categories)
+        if isinstance(column, Categorical) else _frozen(column[mask])
+        for column in table
+    ))
+
+
+def field_equals(field, value):
+    """Vectorized predicate: a mask of rows whose `field` equals `value`."""
+    def predicate(table):
+        column = getattr(table, field)
+        if isinstance(column, Categorical):
+            if value not in column.categories:
+                return np.zeros(len(column.codes), dtype=bool)
+            return column.codes == column.categories.index(value)
+        return column == value
+    return predicate
+
+
+def create_table_filter(predicate):
+    """Higher-order function: like `create_filter`, for tables.
+
+    `predicate` maps a table to a boolean mask, e.g. `field_equals`.
+    Table filters chain with `compose` just as list filters do.
+    """
+    return lambda table: where(table, predicate(table))
+
+
+def table_g_stats(table):
+    """`g_stats` for a whole table."""
+    g = table_g(table)
+    if not g.size:
+        return EMPTY_STATS
+    mean = g.mean()
+    return Stats(g.size, float(mean), float(((g - mean) ** 2).sum()),
+                 float(g.min()), float(g.max()))
+
+
+def table_g_stats_by(table, by):
+    """`g_stats` per value of the column `by`, in one vectorized sweep.
+
+    Returns a read-only mapping like `g_stats_by(group_by(by)(trials))`,
+    with keys in sorted order.
+    """
+    column = getattr(table, by)
+    if isinstance(column, Categorical):
+        codes, keys = column.codes, column.categories
+    else:
+        keys, codes = np.unique(column, return_inverse=True)
+        keys = keys.tolist()
+
+    g = table_g(table)
+    groups = len(keys)
+    count = np.bincount(codes, minlength=groups)
+    mean = np.bincount(codes, g, minlength=groups) / np.maximum(count, 1)
+    m2 = np.bincount(codes, (g - mean[codes]) ** 2, minlength=groups)
+    low = np.full(groups, math.inf)
+    high = np.full(groups, -math.inf)
+    np.minimum.at(low, codes, g)
+    np.maximum.at(high, codes, g)
+    return MappingProxyType({
+        key: Stats(int(count[i]), float(mean[i]), float(m2[i]), float(low[i]), float(high[i]))
+        for i, key in enumerate(keys)
+        if count[i]
+    })
+
+
+# ── PERF 4: Streaming ingestion ───────────────────────────
+# Trials on disk, one row per trial with a header of the Trial fields:
+# CSV (standard library) or Parquet (needs pyarrow). Readers are
+# generators that hold one batch at a time, so they feed `compose`
+# pipelines and the one-pass statistics straight from the file.
+
+# Rows read per batch (and written per Parquet row group)
+BATCH_SIZE = 65_536
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+_FIELD_TYPES = (int, float, float, float, str, str)
+
+
+def _is_parquet(path):
+    return path.lower().endswith(PARQUET_SUFFIXES)
+
+
+def _batches(iterable, batch_size):
+    """Split an iterable into lists of at most `batch_size` items."""
+    iterator = iter(iterable)
+    return iter(lambda: list(islice(iterator, batch_size)), [])
+
+
+def _csv_trials(path):
+    with open(path, newline="") as f:
+        rows = csv.reader(f)
+        header = tuple(next(rows, ()))
+        if header != Trial._fields:
+            raise ValueError(f"{path}: expected columns {Trial._fields}, got {header}")
+        for row in rows:
+            if not row:
+                continue
+            if len(row) != len(Trial._fields):
+                raise ValueError(f"{path}, line {rows.line_num}: expected "
+                                 f"{len(Trial._fields)} columns, got {len(row)}")
+            yield Trial(*(convert(value) for convert, value in zip(_FIELD_TYPES, row)))
+
+
+def _parquet_batches(path, batch_size):
+    """Yield pyarrow record batches, reading through a memory map."""
+    import pyarrow.parquet as pq
+
+    parquet = pq.ParquetFile(path, memory_map=True, read_dictionary=CATEGORICAL_FIELDS)
+    yield from parquet.iter_batches(batch_size=batch_size, columns=list(Trial._fields))
+
+
+def _arrow_table(batch):
+    """A `TrialTable` over one record batch, sharing numeric buffers."""
+    def column(name, dtype):
+        array = batch.column(name)
+        if name in CATEGORICAL_FIELDS:
+            if not hasattr(array, "indices"):
+                array = array.dictionary_encode()
+            return _sorted_categorical(array.indices.to_numpy(), array.dictionary.to_pylist())
+        return _frozen(array.to_numpy().astype(dtype, copy=False))
+
+    return TrialTable(*(
+        column(name, np.int64 if convert is int else np.float64)
+        for name, convert in zip(Trial._fields, _FIELD_TYPES)
+    ))
+
+
+def read_trials(path, batch_size=BATCH_SIZE):
+    """Lazily yield the Trials stored in a CSV or Parquet file."""
+    if not _is_parquet(path):
+        return _csv_trials(path)
+    return chain.from_iterable(map(from_table, read_trial_tables(path, batch_size)))
+
+
+def read_trial_tables(path, batch_size=BATCH_SIZE):
+    """Lazily yield a file's trials as `TrialTable`s of `batch_size` rows."""
+    if not _is_parquet(path):
+        return map(to_table, _batches(_csv_trials(path), batch_size))
+    return map(_arrow_table, _parquet_batches(path, batch_size))
+
+
+def write_trials(path, trials, batch_size=BATCH_SIZE):
+    """Stream an iterable of trials to a CSV or Parquet file."""
+    if not _is_parquet(path):
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(Trial._fields)
+            writer.writerows(trials)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        (name, pa.int64() if convert is int else pa.float64() if convert is float else pa.string())
+        for name, convert in zip(Trial._fields, _FIELD_TYPES)
+    ])
+    with pq.ParquetWriter(path, schema) as writer:
+        for batch in _batches(trials, batch_size):
+            writer.write_batch(pa.RecordBatch.from_arrays(
+                [pa.array(column, type=field.type) for column, field in zip(zip(*batch), schema)],
+                schema=schema,
+            ))
+
+
+def merge_stats_by(a, b):
+    """Combine two key → Stats mappings, e.g. from consecutive batches."""
+    return MappingProxyType({
+        key: merge_stats(a.get(key, EMPTY_STATS), b.get(key, EMPTY_STATS))
+        for key in sorted({*a, *b})
+    })
+
+
+# ── PERF 5: Lazy pipelines ────────────────────────────────
+
+class Stage(namedtuple("Stage", ["kind", "fn"])):
+    """A lazy pipeline step: "filter" by a predicate or "map" a function.
+
+    Called on its own it returns an iterator, never a list.
+    """
+
+    def __call__(self, items):
+        return (filter if self.kind == "filter" else map)(self.fn, items)
+
+
+def lazy_filter(predicate):
+    return Stage("filter", predicate)
+
+
+def lazy_map(fn):
+    return Stage("map", fn)
+
+
+# Items measured when `pipeline` reorders predicates
+SELECTIVITY_SAMPLE = 1024
+
+
+def order_by_selectivity(predicates, sample):
+    """Order predicates so the cheapest rejections run first.
+
+    Each predicate is timed on `sample` and ranked by cost per item over
+    the fraction of items it rejects, the classic optimal order for
+    independent filters. Predicates that reject nothing go last.
+    """
+    def rank(predicate):
+        start = time.perf_counter()
+        passed = sum(map(bool, map(predicate, sample)))
+        cost = time.perf_counter() - start
+        rejected = 1 - passed / len(sample)
+        return cost / rejected if rejected else math.inf
+
+    if not sample:
+        return tuple(predicates)
+    return tuple(sorted(predicates, key=rank))
+
+
+def _fuse(stages, reorder, sample_size):
+    """One lazy function for a run of stages, in the order they apply.
+
+    The stages become nested `filter`/`map` iterators, so every item flows
+    through the whole run before the next is read and nothing is stored.
+    Filters between two maps commute, so with `reorder` each such group is
+    sorted by `order_by_selectivity` on the first `sample_size` items to
+    reach it.
+    """
+    def run(items):
+        items = iter(items)
+        i = 0
+        while i < len(stages):
+            if stages[i].kind == "map":
+                items = map(stages[i].fn, items)
+                i += 1
+                continue
+            j = i
+            while j < len(stages) and stages[j].kind == "filter":
+                j += 1
+            predicates = [stage.fn for stage in stages[i:j]]
+            if reorder and len(predicates) > 1:
+                sample = list(islice(items, sample_size))
+                predicates = order_by_selectivity(predicates, sample)
+                items = chain(sample, items)
+            for predicate in predicates:
+                items = filter(predicate, items)
+            i = j
+        return items
+
+    return run
+
+
+def pipeline(*functions, reorder=False, sample_size=SELECTIVITY_SAMPLE):
+    """Like `compose`, but runs of `Stage`s fuse into one lazy pass.
+
+    `pipeline(average_g, clean_only, indoor_only)` with lazy filters reads
+    each trial once and hands the survivors straight to `average_g`, in
+    constant memory; any reduction that takes an iterable works as the
+    terminal step. Plain functions are applied as they are.
+    """
+    segments = []
+    for fn in reversed(functions):
+        if isinstance(fn, Stage):
+            if segments and isinstance(segments[-1], list):
+                segments[-1].append(fn)
+            else:
+                segments.append([fn])
+        else:
+            segments.append(fn)
+    steps = [
+        _fuse(segment, reorder, sample_size) if isinstance(segment, list) else segment
+        for segment in segments
+    ]
+    return compose(*reversed(steps))
+
+
+def demo_performance():
+    print("\n" + "=" * 55)
+    print("      PERFORMANCE EXTENSIONS")
+    print("=" * 55)
+
+    # PERF 1: Composite grouping
+    by_setup = group_by(("location", "length_m"))(ALL_DATA)
+    print(f"\n  By Location and Length:")
+    print(f"  {'—' * 50}")
+    for loc, length in sorted(by_setup.keys()):
+        trials = by_setup[loc, length]
+        print(
+            f"    {loc:10s} | L = {length:4.2f} m | {len(trials):2d} trials | "
+            f"avg g = {average_g(trials):.4f} m/s²"
+        )
+
+    # PERF 2: Statistics of separate chunks merge into the whole
+    chunks = [EXPERIMENT_DATA, BASEMENT_DATA]
+    merged = reduce(merge_stats, map(g_stats, chunks), EMPTY_STATS)
+    whole = g_stats(ALL_DATA)
+    print(f"\n  Merged Statistics ({len(chunks)} chunks → {merged.count} trials):")
+    print(f"  {'—' * 50}")
+    print(f"    mean g = {merged.mean:.4f} | σ = {std_deviation(merged):.4f} | "
+          f"range {merged.min:.2f}-{merged.max:.2f} m/s²")
+    print(f"    matches one pass over all trials: "
+          f"{math.isclose(merged.mean, whole.mean) and math.isclose(merged.m2, whole.m2)}")
+
+    # PERF 3: The clean + indoor analysis on a columnar table
+    table = to_table(ALL_DATA)
+    clean_only = create_table_filter(field_equals("notes", "clean"))
+    indoor_only = create_table_filter(lambda tb: ~field_equals("location", "Rooftop")(tb))
+    filtered = compose(clean_only, indoor_only)(table)
+    print(f"\n  Columnar Table ({len(table.trial_id)} trials, "
+          f"round trip lossless: {from_table(table) == tuple(ALL_DATA)}):")
+    print(f"  {'—' * 50}")
+    from_lists = average_g(compose(
+        create_filter(lambda t: t.notes == "clean"),
+        create_filter(lambda t: t.location != "Rooftop"),
+    )(ALL_DATA))
+    table_avg = table_g_stats(filtered).mean
+    print(f"    clean + indoor: {len(filtered.trial_id)} trials, avg g = {table_avg:.4f} m/s² "
+          f"(matches lists: {math.isclose(table_avg, from_lists)})")
+    for loc, s in table_g_stats_by(table, "location").items():
+        print(f"    {loc:10s} | {s.count:2d} trials | "
+              f"avg g = {s.mean:.4f} | σ = {std_deviation(s):.4f} m/s²")
+
+    copies = 50_000
+    many = ALL_DATA * copies
+    big = to_table(many)
+    start = time.perf_counter()
+    by_list = g_stats_by(trials_by_location(many))
+    list_s = time.perf_counter() - start
+    start = time.perf_counter()
+    by_table = table_g_stats_by(big, "location")
+    table_s = time.perf_counter() - start
+    agree = all(math.isclose(by_list[loc].mean, by_table[loc].mean) for loc in by_list)
+    print(f"    {len(many):,} trials, stats by location: lists {list_s * 1000:.0f} ms, "
+          f"table {table_s * 1000:.0f} ms (agree: {agree})")
+
+    # PERF 4: The same analysis streamed from files on disk
+    copies = 10_000
+    print(f"\n  Streaming from Disk ({len(ALL_DATA) * copies:,} trials):")
+    print(f"  {'—' * 50}")
+    clean_only = create_filter(lambda t: t.notes == "clean")
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("trials.csv", "trials.parquet"):
+            path = os.path.join(directory, name)
+            write_trials(path, chain.from_iterable(repeat(ALL_DATA, copies)))
+            size_mib = os.path.getsize(path) / 2 ** 20
+
+            start = time.perf_counter()
+            clean_avg = compose(average_g, clean_only)(read_trials(path))
+            trials_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            by_location = reduce(merge_stats_by,
+                                 map(lambda tb: table_g_stats_by(tb, "location"),
+                                     read_trial_tables(path)))
+            tables_s = time.perf_counter() - start
+            lab_a = by_location["Lab A"]
+            print(f"    {name:14s} {size_mib:5.2f} MiB | clean avg g = {clean_avg:.4f} "
+                  f"({trials_s * 1000:.0f} ms) | Lab A σ = {std_deviation(lab_a):.4f} "
+                  f"({tables_s * 1000:.0f} ms)")
+
+    # PERF 5: Eager list filters vs one fused lazy pass
+    copies = 10_000
+    fresh_trials = lambda: (
+        Trial(i, *t[1:]) for i, t in enumerate(chain.from_iterable(repeat(ALL_DATA, copies)))
+    )
+    is_clean = lambda t: t.notes == "clean"
+    is_indoor = lambda t: t.location != "Rooftop"
+    is_long = lambda t: t.length_m >= 1.0
+    queries = [
+        ("compose, lists", compose(
+            average_g, create_filter(is_clean), create_filter(is_indoor),
+            create_filter(is_long))),
+        ("pipeline, lazy", pipeline(
+            average_g, create_filter(is_clean, lazy=True), create_filter(is_indoor, lazy=True),
+            create_filter(is_long, lazy=True))),
+        ("  + reordering", pipeline(
+            average_g, lazy_filter(is_clean), lazy_filter(is_indoor), lazy_filter(is_long),
+            reorder=True)),
+    ]
+    print(f"\n  Filter Chains ({len(ALL_DATA) * copies:,} streamed trials, 3 filters):")
+    print(f"  {'—' * 50}")
+    for label, query in queries:
+        start = time.perf_counter()
+        avg = query(fresh_trials())
+        elapsed = time.perf_counter() - start
+        # Memory is measured on a second run, as tracing slows everything down
+        tracemalloc.start()
+        query(fresh_trials())
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"    {label:14s} | avg g = {avg:.4f} | {elapsed * 1000:6.0f} ms | "
+              f"peak {peak / 1024:8.1f} KiB")
+
+    print(f"\n{'=' * 55}")
+
+
 if __name__ == "__main__":
     demo()
     demo_extensions()
+    if "--perf" in sys.argv[1:]:
+        demo_performance()